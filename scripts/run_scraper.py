@@ -5,6 +5,8 @@ Script to run the plant scraper.
 
 import os
 import sys
+import asyncio
+import logging
 import argparse
 from pathlib import Path
 
@@ -15,6 +17,12 @@ from src.scraper.plant_list import PlantListScraper
 from src.scraper.plant_details import PlantDetailsScraper
 from src import config
 
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Run the plant scraper")
@@ -22,12 +30,19 @@ def parse_args():
                         help="Type of scraper to run (list, details, or all)")
     parser.add_argument("--limit", type=int, help="Limit the number of plants to scrape")
     parser.add_argument("--output-dir", help="Output directory for scraped data")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Overlap plant detail requests and parsing using asyncio")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     return parser.parse_args()
 
 def main():
     """Main function."""
     args = parse_args()
     
+    # Set logging level
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
     # Set output directory if provided
     if args.output_dir:
         output_dir = args.output_dir
@@ -42,11 +57,8 @@ def main():
     if args.type in ["list", "all"]:
         print("\n=== Running Plant List Scraper ===\n")
         list_scraper = PlantListScraper()
-        plants = list_scraper.scrape()
         
-        if plants:
-            list_scraper.save_to_csv(plants, plants_csv)
-        else:
+        if not list_scraper.scrape_to_csv(plants_csv):
             print("❌ No plants were successfully scraped")
             if args.type == "all":
                 print("Skipping details scraper since no plants were found")
@@ -56,7 +68,10 @@ def main():
     if args.type in ["details", "all"]:
         print("\n=== Running Plant Details Scraper ===\n")
         details_scraper = PlantDetailsScraper(plants_csv=plants_csv)
-        plants = details_scraper.scrape_all(limit=args.limit)
+        if args.use_async:
+            plants = asyncio.run(details_scraper.scrape_all_async(limit=args.limit))
+        else:
+            plants = details_scraper.scrape_all(limit=args.limit)
         
         if not plants:
             print("\n❌ No plant details were successfully scraped")
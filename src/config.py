@@ -34,8 +34,13 @@ GITHUB_REPO = os.getenv("GITHUB_REPO", "plantScraper")
 # Scraper settings
 REQUEST_TIMEOUT = 10  # seconds
 REQUEST_DELAY = 1  # seconds between requests
+MAX_REQUEST_DELAY = 30  # seconds between requests when backing off from errors
+MAX_RETRY_WAIT = 60  # total seconds a request may spend sleeping between retries
+CONCURRENCY = 5  # maximum in-flight requests when scraping asynchronously
+PARSE_WORKERS = os.cpu_count() or 1  # processes parsing pages when scraping asynchronously
 VERIFY_SSL = False  # Whether to verify SSL certificates
 
 # File paths
 PLANTS_CSV = os.path.join(DATA_DIR, "plants.csv")
 PLANTS_DETAILED_JSON = os.path.join(OUTPUT_DIR, "plants_detailed.json")
+PLANTS_PROGRESS_NDJSON = os.path.join(OUTPUT_DIR, "plants_detailed.ndjson")  # one plant per line, written as scraped
@@ -19,15 +19,26 @@ warnings.warn(
     stacklevel=2
 )
 
+import re
 import time
+import asyncio
 import logging
 import ssl
 import certifi
 import httpx
-from notion_client import Client
+from notion_client import Client, AsyncClient
 from notion_client.errors import APIResponseError
 from src.notion import config
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 # Create a custom SSL context that doesn't verify certificates
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 ssl_context.check_hostname = False
@@ -36,6 +47,105 @@ ssl_context.verify_mode = ssl.CERT_NONE
 # Set up logging
 logger = logging.getLogger(__name__)
 
+class _OrjsonBodyMixin:
+    """Serialize JSON request bodies with orjson instead of the stdlib encoder."""
+    
+    def build_request(self, method, url, *, json=None, headers=None, **kwargs):
+        if json is not None:
+            kwargs["content"] = _json_dumps(json)
+            headers = httpx.Headers(headers)
+            headers["Content-Type"] = "application/json"
+        return super().build_request(method, url, headers=headers, **kwargs)
+
+def _retry_delay(response, attempt):
+    """
+    Work out how long to wait before retrying a request.
+    
+    Args:
+        response (httpx.Response): Response that triggered the retry
+        attempt (int): Zero-based number of the attempt that failed
+        
+    Returns:
+        float: Delay in seconds, taken from the Retry-After header if present
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return config.NOTION_RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+# Requests that are safe to repeat after a server error. A POST such as
+# create_page may already have been applied when a 5xx arrives, so it is only
+# retried when it was rate limited (429), which Notion rejects before applying
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PATCH", "DELETE"])
+# PATCH /blocks/{id}/children appends rather than replaces, so it is not idempotent
+_APPEND_CHILDREN_RE = re.compile(r'/blocks/[^/]+/children/?$')
+
+def _should_retry(request, response):
+    """
+    Decide whether a request can be retried after the given response.
+    
+    Args:
+        request (httpx.Request): Request that was sent
+        response (httpx.Response): Response it got
+        
+    Returns:
+        bool: True if the request should be sent again
+    """
+    if response.status_code not in config.NOTION_RETRY_STATUS_CODES:
+        return False
+    if response.status_code == 429:
+        return True
+    return request.method in _IDEMPOTENT_METHODS and not (
+        request.method == "PATCH" and _APPEND_CHILDREN_RE.search(request.url.path)
+    )
+
+class _RetryTransport(httpx.HTTPTransport):
+    """Transport that retries rate-limited and failed idempotent requests with exponential backoff."""
+    
+    def __init__(self, max_retries=None, **kwargs):
+        kwargs.setdefault("retries", config.NOTION_MAX_RETRIES)
+        super().__init__(**kwargs)
+        self.max_retries = config.NOTION_MAX_RETRIES if max_retries is None else max_retries
+    
+    def handle_request(self, request):
+        for attempt in range(self.max_retries + 1):
+            response = super().handle_request(request)
+            if not _should_retry(request, response) or attempt == self.max_retries:
+                return response
+            
+            delay = _retry_delay(response, attempt)
+            response.close()
+            logger.warning(f"Notion API returned {response.status_code}, retrying in {delay} seconds")
+            time.sleep(delay)
+
+class _AsyncRetryTransport(httpx.AsyncHTTPTransport):
+    """Asynchronous transport that retries rate-limited and failed idempotent requests with exponential backoff."""
+    
+    def __init__(self, max_retries=None, **kwargs):
+        kwargs.setdefault("retries", config.NOTION_MAX_RETRIES)
+        super().__init__(**kwargs)
+        self.max_retries = config.NOTION_MAX_RETRIES if max_retries is None else max_retries
+    
+    async def handle_async_request(self, request):
+        for attempt in range(self.max_retries + 1):
+            response = await super().handle_async_request(request)
+            if not _should_retry(request, response) or attempt == self.max_retries:
+                return response
+            
+            delay = _retry_delay(response, attempt)
+            await response.aclose()
+            logger.warning(f"Notion API returned {response.status_code}, retrying in {delay} seconds")
+            await asyncio.sleep(delay)
+
+class _HTTPClient(_OrjsonBodyMixin, httpx.Client):
+    """HTTP client used by NotionClient."""
+
+class _AsyncHTTPClient(_OrjsonBodyMixin, httpx.AsyncClient):
+    """HTTP client used by AsyncNotionClient."""
+
 class NotionClient:
     """Client for interacting with the Notion API."""
     
@@ -49,7 +159,15 @@ class NotionClient:
         """
         self.api_key = api_key or config.NOTION_API_KEY
         self.database_id = database_id or config.NOTION_DATABASE_ID
-        self.client = Client(auth=self.api_key)
+        # One pooled HTTP/2 client per NotionClient, so connections are reused across requests
+        self.http_client = _HTTPClient(transport=_RetryTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=config.NOTION_MAX_CONNECTIONS,
+                max_keepalive_connections=config.NOTION_MAX_CONNECTIONS
+            )
+        ))
+        self.client = Client(auth=self.api_key, client=self.http_client)
         self.last_request_time = 0
     
     def _throttle_requests(self):
@@ -216,3 +334,127 @@ class NotionClient:
         """
         self._throttle_requests()
         return self.client.blocks.children.append(block_id, children=children)
+
+
+class AsyncNotionClient:
+    """
+    Asynchronous client for interacting with the Notion API.
+    
+    All requests share pooled HTTP/2 connections, so they are multiplexed
+    instead of each paying for a new connection.
+    """
+    
+    def __init__(self, api_key=None, database_id=None, max_connections=None):
+        """
+        Initialize the asynchronous Notion client.
+        
+        Args:
+            api_key (str, optional): Notion API key. Defaults to config.NOTION_API_KEY.
+            database_id (str, optional): Notion database ID. Defaults to config.NOTION_DATABASE_ID.
+            max_connections (int, optional): Maximum number of open connections.
+                Defaults to config.NOTION_MAX_CONNECTIONS.
+        """
+        self.api_key = api_key or config.NOTION_API_KEY
+        self.database_id = database_id or config.NOTION_DATABASE_ID
+        max_connections = max_connections or config.NOTION_MAX_CONNECTIONS
+        self.http_client = _AsyncHTTPClient(transport=_AsyncRetryTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        ))
+        self.client = AsyncClient(auth=self.api_key, client=self.http_client)
+        self.last_request_time = 0
+        self._throttle_lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying HTTP connection."""
+        await self.client.aclose()
+    
+    async def _throttle_requests(self):
+        """
+        Throttle requests to respect Notion API rate limits.
+        """
+        async with self._throttle_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
+            
+            # Ensure at least 1/3 second between requests (3 requests per second limit)
+            if time_since_last_request < (1 / config.NOTION_RATE_LIMIT_PER_SECOND):
+                sleep_time = (1 / config.NOTION_RATE_LIMIT_PER_SECOND) - time_since_last_request
+                await asyncio.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
+    
+    async def create_page(self, properties, children=None):
+        """
+        Create a new page in the database.
+        
+        Args:
+            properties (dict): Page properties
+            children (list, optional): Page content blocks. Defaults to None.
+            
+        Returns:
+            dict: Created page
+        """
+        await self._throttle_requests()
+        return await self.client.pages.create(
+            parent={"database_id": self.database_id},
+            properties=properties,
+            children=children or []
+        )
+    
+    async def update_page(self, page_id, properties=None, archived=None):
+        """
+        Update a page in the database.
+        
+        Args:
+            page_id (str): Page ID
+            properties (dict, optional): Page properties to update. Defaults to None.
+            archived (bool, optional): Whether to archive the page. Defaults to None.
+            
+        Returns:
+            dict: Updated page
+        """
+        await self._throttle_requests()
+        params = {}
+        if properties is not None:
+            params["properties"] = properties
+        if archived is not None:
+            params["archived"] = archived
+            
+        return await self.client.pages.update(page_id, **params)
+    
+    async def get_block_children(self, block_id):
+        """
+        Get the children of a block.
+        
+        Args:
+            block_id (str): Block ID
+            
+        Returns:
+            dict: Block children
+        """
+        await self._throttle_requests()
+        return await self.client.blocks.children.list(block_id)
+    
+    async def append_block_children(self, block_id, children):
+        """
+        Append children to a block.
+        
+        Args:
+            block_id (str): Block ID
+            children (list): Block children to append
+            
+        Returns:
+            dict: Updated block children
+        """
+        await self._throttle_requests()
+        return await self.client.blocks.children.append(block_id, children=children)
@@ -35,10 +35,19 @@ NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID", "")
 # Path to plants detailed JSON file
 PLANTS_DETAILED_JSON = config.PLANTS_DETAILED_JSON
 
+# Path to the file recording the last synchronization, used for incremental syncs
+NOTION_SYNC_STATE_FILE = os.path.join(config.OUTPUT_DIR, "last_sync.json")
+
 # Notion API rate limits
 NOTION_RATE_LIMIT_PER_SECOND = 3
 NOTION_RATE_LIMIT_PER_MINUTE = 90
 
+# Notion API connection pooling and retry settings
+NOTION_MAX_CONNECTIONS = 32
+NOTION_MAX_RETRIES = 5
+NOTION_RETRY_BACKOFF_FACTOR = 0.5  # seconds, doubled on each retry
+NOTION_RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
 # Validation
 def validate_config():
     """
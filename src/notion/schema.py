@@ -72,6 +72,18 @@ PLANT_DATABASE_SCHEMA = {
     # Note: Pests/Diseases and Recipes will be handled as tables in page content
 }
 
+# Properties used only to track sync state; not required for a database to be valid
+SYNC_METADATA_SCHEMA = {
+    "ContentHash": {
+        "rich_text": {}
+    }
+}
+
+# (name, type) of every required property, computed once instead of per validation
+_REQUIRED_PROPERTY_TYPES = tuple(
+    (prop_name, next(iter(prop_config))) for prop_name, prop_config in PLANT_DATABASE_SCHEMA.items()
+)
+
 def validate_database_schema(database):
     """
     Validate that a database has the required schema.
@@ -86,20 +98,14 @@ def validate_database_schema(database):
         return False, list(PLANT_DATABASE_SCHEMA.keys())
     
     properties = database["properties"]
-    missing_properties = []
     
-    for prop_name, prop_config in PLANT_DATABASE_SCHEMA.items():
-        # Check if property exists
-        if prop_name not in properties:
-            missing_properties.append(prop_name)
-            continue
-        
-        # Check if property has the correct type
-        prop_type = next(iter(prop_config.keys()))
-        if prop_type not in properties[prop_name]:
-            missing_properties.append(prop_name)
+    # A property is missing if it doesn't exist or doesn't have the correct type
+    missing_properties = [
+        prop_name for prop_name, prop_type in _REQUIRED_PROPERTY_TYPES
+        if prop_type not in properties.get(prop_name, ())
+    ]
     
-    return len(missing_properties) == 0, missing_properties
+    return not missing_properties, missing_properties
 
 def get_database_creation_schema():
     """
@@ -108,4 +114,4 @@ def get_database_creation_schema():
     Returns:
         dict: Database schema for creation
     """
-    return PLANT_DATABASE_SCHEMA
+    return {**PLANT_DATABASE_SCHEMA, **SYNC_METADATA_SCHEMA}
@@ -21,52 +21,127 @@ warnings.warn(
 
 import json
 import os
+import asyncio
+import hashlib
+import functools
 import logging
+from datetime import datetime, timedelta, timezone
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps_sorted(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps_sorted(obj):
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
 from src.notion import config
-from src.notion.client import NotionClient
+from src.notion.client import NotionClient, AsyncNotionClient
 from src.notion.schema import validate_database_schema, get_database_creation_schema
 from src.notion.transformer import transform_plant_to_notion_properties, create_plant_content_blocks
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-def load_plants_data(file_path=None):
+# Page property holding the hash of the plant data last synced to the page
+CONTENT_HASH_PROPERTY = "ContentHash"
+
+# Notion rounds last_edited_time down to the minute, so incremental queries look back this far
+_SINCE_MARGIN = timedelta(minutes=1)
+
+def load_plants_data(file_path=None, stream=True):
     """
     Load plants data from JSON file.
     
+    When streaming, plants are parsed one at a time as the returned iterator is
+    consumed, so the whole file never has to be held in memory. A plant is only
+    yielded once it has been parsed completely, so a truncated file raises before
+    its incomplete plant is handed out.
+    
     Args:
         file_path (str, optional): Path to JSON file. Defaults to config.PLANTS_DETAILED_JSON.
+        stream (bool, optional): Whether to stream plants with ijson if it is installed.
+            Defaults to True.
         
     Returns:
-        list: List of plant dictionaries
+        iterable: Plant dictionaries (a generator when streaming, otherwise a list)
         
     Raises:
         FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
+        ValueError: If the file contains invalid JSON (raised while iterating
+            when streaming)
     """
     file_path = file_path or config.PLANTS_DETAILED_JSON
     
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Plants data file not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    if stream and ijson is not None:
+        return _iter_plants_data(file_path)
+    
+    with open(file_path, 'rb') as f:
+        return _json_loads(f.read())
 
-def get_existing_plants(client):
+def _iter_plants_data(file_path):
+    """
+    Yield plants from a JSON array file one at a time.
+    
+    Args:
+        file_path (str): Path to JSON file
+        
+    Yields:
+        dict: Plant data
+        
+    Raises:
+        ValueError: If the file contains invalid JSON
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            yield from ijson.items(f, 'item', use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {file_path}: {str(e)}") from e
+
+def get_existing_plants(client, include_hashes=False, since=None):
     """
     Get existing plants from the Notion database.
     
     Args:
         client (NotionClient): Notion client
+        include_hashes (bool, optional): Whether to also return the content hashes
+            stored on each page. Defaults to False.
+        since (datetime, optional): Only return pages last edited on or after this
+            time. The filter is applied by Notion. Defaults to None (all pages).
         
     Returns:
-        dict: Dictionary mapping plant names to page IDs
+        dict: Dictionary mapping plant names to page IDs, or a tuple
+            (plant_page_map, content_hashes) if include_hashes is True.
+            content_hashes maps plant names to their stored hash, and is None
+            when the database has no ContentHash property.
     """
     plant_page_map = {}
+    content_hashes = {}
+    tracks_hashes = True
     
     try:
-        # Query all pages in the database
-        response = client.query_database()
+        # Query all pages in the database, or only recently edited ones
+        query_filter = None
+        if since is not None:
+            query_filter = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {
+                    "on_or_after": since.isoformat()
+                }
+            }
+        response = client.query_database(filter=query_filter)
         
         # Extract plant names and page IDs
         for page in response.get("results", []):
@@ -74,11 +149,161 @@ def get_existing_plants(client):
             if "title" in title_property and title_property["title"]:
                 plant_name = title_property["title"][0]["text"]["content"]
                 plant_page_map[plant_name] = page["id"]
+                
+                # Extract the hash of the content last synced to this page
+                hash_property = page["properties"].get(CONTENT_HASH_PROPERTY)
+                if hash_property is None:
+                    tracks_hashes = False
+                elif hash_property.get("rich_text"):
+                    content_hashes[plant_name] = hash_property["rich_text"][0]["text"]["content"]
+        
+        # With no pages to inspect, check the database schema directly
+        if include_hashes and not plant_page_map:
+            database = client.get_database()
+            tracks_hashes = CONTENT_HASH_PROPERTY in database.get("properties", {})
     except Exception as e:
         logger.error(f"Error querying database: {str(e)}")
     
+    if include_hashes:
+        return plant_page_map, content_hashes if tracks_hashes else None
     return plant_page_map
 
+def compute_content_hash(plant):
+    """
+    Compute a stable hash of a plant's data.
+    
+    Args:
+        plant (dict): Plant data
+        
+    Returns:
+        str: Hex digest that changes whenever any field of the plant changes
+    """
+    return hashlib.blake2b(_json_dumps_sorted(plant), digest_size=16).hexdigest()
+
+class _HashedPlant:
+    """Hashable wrapper identifying a plant by its name and content hash."""
+    
+    __slots__ = ("plant", "key")
+    
+    def __init__(self, plant, content_hash):
+        self.plant = plant
+        self.key = (plant["Name"], content_hash)
+    
+    def __hash__(self):
+        return hash(self.key)
+    
+    def __eq__(self, other):
+        return isinstance(other, _HashedPlant) and self.key == other.key
+
+@functools.lru_cache(maxsize=256)
+def _transform_plant(hashed_plant):
+    """
+    Transform a plant to Notion properties and content blocks, memoized on content.
+    
+    Args:
+        hashed_plant (_HashedPlant): Plant to transform
+        
+    Returns:
+        tuple: (properties, content_blocks). Callers must not mutate these.
+    """
+    plant = hashed_plant.plant
+    return transform_plant_to_notion_properties(plant), create_plant_content_blocks(plant)
+
+def _prepare_plant_page(plant, content_hashes):
+    """
+    Build the Notion payload for a plant unless its content is unchanged.
+    
+    Args:
+        plant (dict): Plant data
+        content_hashes (dict or None): Dictionary mapping plant names to the hash
+            stored on their page, or None if the database doesn't track hashes
+            
+    Returns:
+        tuple: (properties, content_blocks), or None if the page is already up to date
+    """
+    content_hash = compute_content_hash(plant)
+    if content_hashes is not None and content_hashes.get(plant["Name"]) == content_hash:
+        return None
+    
+    properties, content_blocks = _transform_plant(_HashedPlant(plant, content_hash))
+    if content_hashes is not None:
+        properties = {
+            **properties,
+            CONTENT_HASH_PROPERTY: {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": content_hash
+                        }
+                    }
+                ]
+            }
+        }
+    return properties, content_blocks
+
+def load_sync_state(file_path=None):
+    """
+    Load the state recorded by the last incremental synchronization.
+    
+    Args:
+        file_path (str, optional): Path to the state file. Defaults to config.NOTION_SYNC_STATE_FILE.
+        
+    Returns:
+        dict: Saved state with "last_synced", "pages" and "content_hashes" keys,
+            or None if there is no usable state file
+    """
+    file_path = file_path or config.NOTION_SYNC_STATE_FILE
+    
+    try:
+        with open(file_path, 'rb') as f:
+            state = _json_loads(f.read())
+        
+        if not (isinstance(state, dict)
+                and isinstance(state.get("last_synced"), str)
+                and isinstance(state.get("pages"), dict)
+                and isinstance(state.get("content_hashes"), (dict, type(None)))):
+            raise ValueError("Sync state is missing last_synced, pages or content_hashes")
+        datetime.fromisoformat(state["last_synced"])
+        return state
+    except (OSError, ValueError) as e:
+        logger.info(f"No usable sync state, doing a full sync: {str(e)}")
+        return None
+
+def save_sync_state(state, file_path=None):
+    """
+    Save the state of a synchronization for the next incremental run.
+    
+    Args:
+        state (dict): State with "last_synced", "pages" and "content_hashes" keys
+        file_path (str, optional): Path to the state file. Defaults to config.NOTION_SYNC_STATE_FILE.
+    """
+    file_path = file_path or config.NOTION_SYNC_STATE_FILE
+    
+    try:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        logger.error(f"Error saving sync state: {str(e)}")
+
+def _get_existing_plants_incremental(client, state):
+    """
+    Get existing plants by updating the last sync's page map with recently edited pages.
+    
+    Args:
+        client (NotionClient): Notion client
+        state (dict): State saved by the last synchronization
+        
+    Returns:
+        tuple: (plant_page_map, content_hashes), as for get_existing_plants
+    """
+    since = datetime.fromisoformat(state["last_synced"]) - _SINCE_MARGIN
+    recent_pages, recent_hashes = get_existing_plants(client, include_hashes=True, since=since)
+    
+    plant_page_map = {**state["pages"], **recent_pages}
+    if recent_hashes is None or state.get("content_hashes") is None:
+        return plant_page_map, None
+    return plant_page_map, {**state["content_hashes"], **recent_hashes}
+
 def ensure_database_exists(client, parent_page_id=None):
     """
     Ensure that the Notion database exists with the correct schema.
@@ -128,7 +353,7 @@ def ensure_database_exists(client, parent_page_id=None):
             logger.error(f"Error creating database: {str(e)}")
             return False
 
-def sync_plant_to_notion(client, plant, existing_plants=None):
+def sync_plant_to_notion(client, plant, existing_plants=None, content_hashes=None):
     """
     Synchronize a single plant to Notion.
     
@@ -137,11 +362,14 @@ def sync_plant_to_notion(client, plant, existing_plants=None):
         plant (dict): Plant data
         existing_plants (dict, optional): Dictionary mapping plant names to page IDs.
             If not provided, will query the database. Defaults to None.
+        content_hashes (dict, optional): Dictionary mapping plant names to the content
+            hash stored on their page. If provided, unchanged plants are not written
+            and the new hash is stored on the page. Defaults to None.
             
     Returns:
         tuple: (success, action, error_message)
             success (bool): Whether the operation was successful
-            action (str): "created", "updated", or "skipped"
+            action (str): "created", "updated", "unchanged", or "skipped"
             error_message (str): Error message if the operation failed
     """
     if not plant.get("Name"):
@@ -153,25 +381,23 @@ def sync_plant_to_notion(client, plant, existing_plants=None):
             existing_plants = get_existing_plants(client)
         
         # Transform plant data to Notion format
-        properties = transform_plant_to_notion_properties(plant)
-        content_blocks = create_plant_content_blocks(plant)
+        page = _prepare_plant_page(plant, content_hashes)
+        if page is None:
+            return True, "unchanged", ""
+        properties, content_blocks = page
         
         # Check if plant already exists
         if plant["Name"] in existing_plants:
-            # Update existing page
             page_id = existing_plants[plant["Name"]]
-            client.update_page(page_id, properties)
-            
-            # Update content blocks
-            # Note: This requires clearing existing blocks and adding new ones
-            # as Notion API doesn't support direct replacement
-            
-            # Get existing blocks
-            blocks = client.get_block_children(page_id)
             
             # Append new blocks
+            # Note: Notion API doesn't support direct replacement of content blocks
             client.append_block_children(page_id, content_blocks)
             
+            # Update properties only once the content is written, so the stored
+            # content hash never claims content that failed to upload
+            client.update_page(page_id, properties)
+            
             return True, "updated", ""
         else:
             # Create new page
@@ -182,87 +408,256 @@ def sync_plant_to_notion(client, plant, existing_plants=None):
         logger.error(f"Error syncing plant '{plant.get('Name', 'unknown')}': {error_message}")
         return False, "skipped", error_message
 
-def sync_plants_to_notion(plants=None, client=None, parent_page_id=None, file_path=None):
+def _iter_unique_plants(plants, duplicates):
+    """
+    Yield plants, skipping any whose name has already been seen.
+    
+    Args:
+        plants (iterable): Plant dictionaries
+        duplicates (list): List that the names of skipped duplicates are appended to
+        
+    Yields:
+        dict: Plant data, at most once per name (plants without a name are kept)
+    """
+    seen_names = set()
+    for plant in plants:
+        name = plant.get("Name")
+        if name:
+            if name in seen_names:
+                duplicates.append(name)
+                continue
+            seen_names.add(name)
+        yield plant
+
+def _iter_plants_until_error(plants, load_errors):
+    """
+    Yield plants until reading them fails.
+    
+    Args:
+        plants (iterable): Plant dictionaries, possibly streamed from a file
+        load_errors (list): List that the message of a read error is appended to
+        
+    Yields:
+        dict: Plant data
+    """
+    try:
+        yield from plants
+    except ValueError as e:
+        load_errors.append(str(e))
+
+async def sync_plant_to_notion_async(client, plant, existing_plants, content_hashes=None):
+    """
+    Synchronize a single plant to Notion using the asynchronous client.
+    
+    For existing plants the content is appended before the page properties are
+    updated, so the content hash is only stored once the content is written.
+    
+    Args:
+        client (AsyncNotionClient): Asynchronous Notion client
+        plant (dict): Plant data
+        existing_plants (dict): Dictionary mapping plant names to page IDs
+        content_hashes (dict, optional): Dictionary mapping plant names to the content
+            hash stored on their page. Defaults to None.
+            
+    Returns:
+        tuple: (success, action, error_message)
+            success (bool): Whether the operation was successful
+            action (str): "created", "updated", "unchanged", or "skipped"
+            error_message (str): Error message if the operation failed
+    """
+    if not plant.get("Name"):
+        return False, "skipped", "Plant has no name"
+    
+    try:
+        # Transform plant data to Notion format
+        page = _prepare_plant_page(plant, content_hashes)
+        if page is None:
+            return True, "unchanged", ""
+        properties, content_blocks = page
+        
+        # Check if plant already exists
+        if plant["Name"] in existing_plants:
+            page_id = existing_plants[plant["Name"]]
+            # Update properties only once the content is written, so the stored
+            # content hash never claims content that failed to upload
+            await client.append_block_children(page_id, content_blocks)
+            await client.update_page(page_id, properties)
+            return True, "updated", ""
+        else:
+            await client.create_page(properties, content_blocks)
+            return True, "created", ""
+    except Exception as e:
+        error_message = str(e)
+        logger.error(f"Error syncing plant '{plant.get('Name', 'unknown')}': {error_message}")
+        return False, "skipped", error_message
+
+async def sync_plants_to_notion_async(plants, existing_plants, client=None, content_hashes=None,
+                                      api_key=None, database_id=None):
+    """
+    Synchronize plants to Notion reusing one asynchronous client for all of them.
+    
+    Args:
+        plants (iterable): Plant dictionaries
+        existing_plants (dict): Dictionary mapping plant names to page IDs
+        client (AsyncNotionClient, optional): Asynchronous Notion client. If not provided,
+            a new client is created and closed when done. Defaults to None.
+        content_hashes (dict, optional): Dictionary mapping plant names to the content
+            hash stored on their page. Defaults to None.
+        api_key (str, optional): Notion API key for the client created when none is
+            provided. Defaults to config.NOTION_API_KEY.
+        database_id (str, optional): Notion database ID for the client created when none
+            is provided. Defaults to config.NOTION_DATABASE_ID.
+            
+    Returns:
+        list: (plant, (success, action, error_message)) pairs, one per plant
+    """
+    owns_client = client is None
+    client = client or AsyncNotionClient(api_key, database_id)
+    
+    try:
+        outcomes = []
+        for plant in plants:
+            outcomes.append((plant, await sync_plant_to_notion_async(
+                client, plant, existing_plants, content_hashes
+            )))
+        return outcomes
+    finally:
+        if owns_client:
+            await client.aclose()
+
+def _error_results(error_message):
+    """
+    Build the results of a synchronization that failed before any plant was processed.
+    
+    Args:
+        error_message (str): Reason the synchronization failed
+        
+    Returns:
+        dict: Synchronization results
+    """
+    return {
+        "success": False,
+        "error": error_message,
+        "created": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+        "errors": []
+    }
+
+def sync_plants_to_notion(plants=None, client=None, parent_page_id=None, file_path=None, use_async=False,
+                          incremental=False, state_file=None):
     """
     Synchronize plants data to Notion database.
     
     Args:
-        plants (list, optional): List of plant dictionaries. If not provided,
-            will load from file_path. Defaults to None.
+        plants (iterable, optional): Plant dictionaries. If not provided,
+            will stream them from file_path. Defaults to None.
         client (NotionClient, optional): Notion client. If not provided,
             will create a new client. Defaults to None.
         parent_page_id (str, optional): Parent page ID for creating a new database
             if it doesn't exist. Defaults to None.
         file_path (str, optional): Path to plants JSON file. Defaults to config.PLANTS_DETAILED_JSON.
+        use_async (bool, optional): Whether to upload plants with the asynchronous
+            HTTP/2 client. Defaults to False.
+        incremental (bool, optional): Whether to only query pages edited since the last
+            incremental run, reusing the page map it saved. Defaults to False.
+        state_file (str, optional): Path to the incremental sync state file.
+            Defaults to config.NOTION_SYNC_STATE_FILE.
             
     Returns:
         dict: Synchronization results
     """
-    # Initialize client if not provided
-    client = client or NotionClient()
-    
     # Validate configuration
     is_valid, error_message = config.validate_config()
     if not is_valid:
-        return {
-            "success": False,
-            "error": error_message,
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": []
-        }
+        return _error_results(error_message)
+    
+    # Check the plants file before making any API calls
+    if not plants:
+        file_path = file_path or config.PLANTS_DETAILED_JSON
+        if not os.path.exists(file_path):
+            return _error_results(f"Error loading plants data: Plants data file not found: {file_path}")
+        if os.path.getsize(file_path) == 0:
+            return _error_results(f"Error loading plants data: Plants data file is empty: {file_path}")
+    
+    # Initialize client if not provided
+    client = client or NotionClient()
     
     # Ensure database exists
     if not ensure_database_exists(client, parent_page_id):
-        return {
-            "success": False,
-            "error": "Database doesn't exist or couldn't be created",
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": []
-        }
+        return _error_results("Database doesn't exist or couldn't be created")
     
     # Load plants if not provided
     try:
         plants = plants or load_plants_data(file_path)
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Error loading plants data: {str(e)}",
-            "created": 0,
-            "updated": 0,
-            "skipped": 0,
-            "errors": []
-        }
+        return _error_results(f"Error loading plants data: {str(e)}")
     
     # Get existing plants
-    existing_plants = get_existing_plants(client)
+    sync_started = datetime.now(timezone.utc)
+    state = load_sync_state(state_file) if incremental else None
+    if state:
+        existing_plants, content_hashes = _get_existing_plants_incremental(client, state)
+    else:
+        existing_plants, content_hashes = get_existing_plants(client, include_hashes=True)
     
     # Track results
     results = {
         "success": True,
         "created": 0,
         "updated": 0,
+        "unchanged": 0,
         "skipped": 0,
         "errors": []
     }
     
-    # Process each plant
-    for plant in plants:
-        success, action, error_message = sync_plant_to_notion(client, plant, existing_plants)
-        
+    # Process each plant, writing each page only once even if its name repeats
+    # A streamed file that turns out to be malformed stops the run at the bad
+    # plant instead of raising out of it
+    duplicates = []
+    load_errors = []
+    plants = _iter_unique_plants(_iter_plants_until_error(plants, load_errors), duplicates)
+    if use_async:
+        # Write to the same database, with the same credentials, as the given client
+        outcomes = asyncio.run(sync_plants_to_notion_async(
+            plants, existing_plants, content_hashes=content_hashes,
+            api_key=client.api_key, database_id=client.database_id
+        ))
+    else:
+        outcomes = (
+            (plant, sync_plant_to_notion(client, plant, existing_plants, content_hashes))
+            for plant in plants
+        )
+    
+    for plant, (success, action, error_message) in outcomes:
         if success:
             if action == "created":
                 results["created"] += 1
             elif action == "updated":
                 results["updated"] += 1
+            elif action == "unchanged":
+                results["unchanged"] += 1
         else:
             results["skipped"] += 1
             results["errors"].append({
                 "plant": plant.get("Name", "unknown"),
                 "error": error_message
             })
+    results["skipped"] += len(duplicates)
+    
+    # Don't record sync state for a run that stopped partway through the file
+    if load_errors:
+        results["success"] = False
+        results["error"] = f"Error loading plants data: {load_errors[0]}"
+        return results
+    
+    # Pages created or updated by this run are picked up by the next run's query
+    if incremental:
+        save_sync_state({
+            "last_synced": sync_started.isoformat(),
+            "pages": existing_plants,
+            "content_hashes": content_hashes
+        }, state_file)
     
     return results
@@ -19,6 +19,71 @@ warnings.warn(
     stacklevel=2
 )
 
+def _select_property(value):
+    """
+    Build a select property from the first line of a value.
+    
+    Args:
+        value (str): Property value, possibly spanning several lines
+        
+    Returns:
+        dict: Notion select property, or None if the first line is empty
+    """
+    # Take the first value if it's a multi-line string
+    name = value.split("\n", 1)[0].strip()
+    if not name:
+        return None
+    return {
+        "select": {
+            "name": name
+        }
+    }
+
+def _multi_select_property(value):
+    """
+    Build a multi-select property with one option per distinct line of a value.
+    
+    Args:
+        value (str): Property value, one option per line
+        
+    Returns:
+        dict: Notion multi-select property
+    """
+    # Deduplicate options while keeping their original order
+    options = dict.fromkeys(option.strip() for option in value.splitlines())
+    options.pop("", None)
+    return {
+        "multi_select": [{"name": option} for option in options]
+    }
+
+# Builders for each simple property type; a builder returns None to leave the property unset
+_PROPERTY_BUILDERS = {
+    "rich_text": lambda value: {"rich_text": [{"text": {"content": value}}]},
+    "url": lambda value: {"url": value},
+    "select": _select_property,
+    "multi_select": _multi_select_property
+}
+
+# Simple plant fields and their Notion property types, in output order
+_FIELD_SPECS = (
+    ("Botanical Name", "rich_text"),
+    ("Photo Credit", "rich_text"),
+    ("Link", "url"),
+    ("Image URL", "url"),
+    ("Plant Type", "select"),
+    ("Soil pH", "select"),
+    ("Sun Exposure", "multi_select"),
+    ("Bloom Time", "multi_select"),
+    ("Flower Color", "multi_select"),
+    ("Hardiness Zone", "multi_select")
+)
+
+# Content sections stored as (truncated) rich text properties
+_CONTENT_SECTIONS = ("Planting", "Growing", "Harvesting", "Wit and Wisdom", "Cooking Notes")
+
+# Notion's length limit for a rich text property
+_MAX_PROPERTY_LENGTH = 2000
+
 def transform_plant_to_notion_properties(plant):
     """
     Transform a plant dictionary to Notion properties format.
@@ -41,78 +106,36 @@ def transform_plant_to_notion_properties(plant):
         }
     }
     
-    # Add text properties
-    for field in ["Botanical Name", "Photo Credit"]:
-        if field in plant and plant[field]:
-            properties[field] = {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": plant[field]
-                        }
-                    }
-                ]
-            }
-    
-    # Add URL properties
-    for field in ["Link", "Image URL"]:
-        if field in plant and plant[field]:
-            properties[field] = {
-                "url": plant[field]
-            }
-    
-    # Add select properties
-    for field in ["Plant Type", "Soil pH"]:
-        if field in plant and plant[field]:
-            # Take the first value if it's a multi-line string
-            value = plant[field].split("\n")[0].strip() if "\n" in plant[field] else plant[field].strip()
-            if value:
-                properties[field] = {
-                    "select": {
-                        "name": value
-                    }
-                }
-    
-    # Add multi-select properties
-    for field in ["Sun Exposure", "Bloom Time", "Flower Color", "Hardiness Zone"]:
-        if field in plant and plant[field]:
-            values = plant[field].split("\n") if "\n" in plant[field] else [plant[field]]
-            if values:
-                properties[field] = {
-                    "multi_select": [
-                        {"name": value.strip()} for value in values if value.strip()
-                    ]
-                }
+    # Add simple properties
+    for field, property_type in _FIELD_SPECS:
+        value = plant.get(field)
+        if value:
+            prop = _PROPERTY_BUILDERS[property_type](value)
+            if prop is not None:
+                properties[field] = prop
     
     # Add rich text properties for content sections
-    for field in ["Planting", "Growing", "Harvesting", "Wit and Wisdom", "Cooking Notes"]:
-        if field in plant:
-            content = ""
-            if isinstance(plant[field], dict) and "content" in plant[field]:
-                content = plant[field]["content"]
-                
-                # Add sub-headings if they exist
-                if "sub_headings" in plant[field]:
-                    for sub_heading, sub_content in plant[field]["sub_headings"].items():
-                        content += f"\n\n{sub_heading}:\n{sub_content}"
-            elif isinstance(plant[field], str):
-                content = plant[field]
-                
-            if content:
-                # Truncate content if it's too long for a property (Notion has a limit)
-                max_length = 2000
-                if len(content) > max_length:
-                    content = content[:max_length-3] + "..."
-                    
-                properties[field] = {
-                    "rich_text": [
-                        {
-                            "text": {
-                                "content": content
-                            }
-                        }
-                    ]
-                }
+    for field in _CONTENT_SECTIONS:
+        section = plant.get(field)
+        content = ""
+        if isinstance(section, dict) and "content" in section:
+            content = section["content"]
+            
+            # Add sub-headings if they exist, joined once rather than appended one by one
+            sub_headings = section.get("sub_headings")
+            if sub_headings:
+                content += "".join(
+                    f"\n\n{sub_heading}:\n{sub_content}" for sub_heading, sub_content in sub_headings.items()
+                )
+        elif isinstance(section, str):
+            content = section
+        
+        if content:
+            # Truncate content if it's too long for a property (Notion has a limit)
+            if len(content) > _MAX_PROPERTY_LENGTH:
+                content = content[:_MAX_PROPERTY_LENGTH - 3] + "..."
+            
+            properties[field] = _PROPERTY_BUILDERS["rich_text"](content)
     
     return properties
 
@@ -212,21 +235,21 @@ def create_bulleted_list_item(content, link=None):
     if not content:
         return None
     
-    text_obj = {
-        "type": "text",
-        "text": {
-            "content": content
-        }
-    }
-    
     if link:
-        text_obj["text"]["link"] = {"url": link}
+        text = {"content": content, "link": {"url": link}}
+    else:
+        text = {"content": content}
     
     return {
         "object": "block",
         "type": "bulleted_list_item",
         "bulleted_list_item": {
-            "rich_text": [text_obj]
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": text
+                }
+            ]
         }
     }
 
@@ -245,45 +268,36 @@ def create_table_block(headers, rows):
         return None
     
     table_width = len(headers)
-    table_children = []
+    table_children = [None] * (len(rows) + 1)
     
     # Add header row
-    header_row = {
+    table_children[0] = {
         "object": "block",
         "type": "table_row",
         "table_row": {
             "cells": [[{"type": "text", "text": {"content": header}}] for header in headers]
         }
     }
-    table_children.append(header_row)
+    
+    # Keys used by dictionary rows (like pests/diseases), normalized once per table
+    header_keys = [header.lower().replace("/", "_").replace(" ", "_") for header in headers]
     
     # Add data rows
-    for row in rows:
+    for i, row in enumerate(rows, 1):
         if isinstance(row, dict):
             # Handle dictionary rows (like pests/diseases)
-            cells = []
-            for header in headers:
-                header_key = header.lower().replace("/", "_").replace(" ", "_")
-                cells.append([{"type": "text", "text": {"content": row.get(header_key, "")}}])
-            
-            data_row = {
-                "object": "block",
-                "type": "table_row",
-                "table_row": {
-                    "cells": cells
-                }
-            }
+            cells = [[{"type": "text", "text": {"content": row.get(key, "")}}] for key in header_keys]
         else:
             # Handle list rows
-            data_row = {
-                "object": "block",
-                "type": "table_row",
-                "table_row": {
-                    "cells": [[{"type": "text", "text": {"content": str(cell)}}] for cell in row]
-                }
-            }
+            cells = [[{"type": "text", "text": {"content": str(cell)}}] for cell in row]
         
-        table_children.append(data_row)
+        table_children[i] = {
+            "object": "block",
+            "type": "table_row",
+            "table_row": {
+                "cells": cells
+            }
+        }
     
     return {
         "object": "block",
@@ -296,95 +310,124 @@ def create_table_block(headers, rows):
         }
     }
 
-def create_plant_content_blocks(plant):
+def _text_section_blocks(heading, section):
     """
-    Create Notion blocks for plant content.
+    Yield blocks for a section with content and optional sub-headings.
     
     Args:
-        plant (dict): Plant data from plants_detailed.json
+        heading (str): Section heading
+        section (dict): Section data with "content" and "sub_headings" keys
         
-    Returns:
-        list: Notion blocks
+    Yields:
+        dict: Notion block or None
     """
-    blocks = []
+    yield create_heading_block(heading)
     
-    # Add plant image
-    if "Image URL" in plant and plant["Image URL"]:
-        image_block = create_image_block(plant["Image URL"])
-        if image_block:
-            blocks.append(image_block)
-    
-    # Add sections for planting, growing, harvesting
-    for section in ["Planting", "Growing", "Harvesting"]:
-        if section in plant:
-            # Add section heading
-            heading_block = create_heading_block(section)
-            if heading_block:
-                blocks.append(heading_block)
-            
-            # Add content paragraph
-            if "content" in plant[section] and plant[section]["content"]:
-                content_block = create_rich_text_block(plant[section]["content"])
-                if content_block:
-                    blocks.append(content_block)
-            
-            # Add sub-headings
-            if "sub_headings" in plant[section]:
-                for sub_heading, content in plant[section]["sub_headings"].items():
-                    sub_heading_block = create_heading_block(sub_heading, level=3)
-                    if sub_heading_block:
-                        blocks.append(sub_heading_block)
-                    
-                    content_block = create_rich_text_block(content)
-                    if content_block:
-                        blocks.append(content_block)
-    
-    # Add pests/diseases table
-    if "Pests/Diseases" in plant and "headers" in plant["Pests/Diseases"] and "rows" in plant["Pests/Diseases"]:
-        # Add section heading
-        heading_block = create_heading_block("Pests and Diseases")
-        if heading_block:
-            blocks.append(heading_block)
+    # Add content paragraph
+    if "content" in section and section["content"]:
+        yield create_rich_text_block(section["content"])
+    
+    # Add sub-headings
+    if "sub_headings" in section:
+        for sub_heading, content in section["sub_headings"].items():
+            yield create_heading_block(sub_heading, level=3)
+            yield create_rich_text_block(content)
+
+def _table_section_blocks(heading, section):
+    """
+    Yield blocks for a section holding a table.
+    
+    Args:
+        heading (str): Section heading
+        section (dict): Table data with "headers" and "rows" keys
         
-        # Create table
-        headers = plant["Pests/Diseases"]["headers"]
-        rows = plant["Pests/Diseases"]["rows"]
+    Yields:
+        dict: Notion block
+    """
+    if "headers" in section and "rows" in section:
+        yield create_heading_block(heading)
+        yield create_table_block(section["headers"], section["rows"])
+
+def _link_list_section_blocks(heading, section):
+    """
+    Yield blocks for a section of named links, e.g. recipes.
+    
+    Args:
+        heading (str): Section heading
+        section (dict): Mapping of link text to URL
         
-        table_block = create_table_block(headers, rows)
-        if table_block:
-            blocks.append(table_block)
-    
-    # Add recipes
-    if "Recipes" in plant and isinstance(plant["Recipes"], dict) and plant["Recipes"]:
-        # Add section heading
-        heading_block = create_heading_block("Recipes")
-        if heading_block:
-            blocks.append(heading_block)
+    Yields:
+        dict: Notion block
+    """
+    if isinstance(section, dict) and section:
+        yield create_heading_block(heading)
+        for name, url in section.items():
+            yield create_bulleted_list_item(name, link=url)
+
+def _paragraph_section_blocks(heading, section):
+    """
+    Yield blocks for a section holding plain text.
+    
+    Args:
+        heading (str): Section heading
+        section (str): Section text
         
-        # Add bulleted list for recipes
-        for recipe_name, recipe_url in plant["Recipes"].items():
-            list_item = create_bulleted_list_item(recipe_name, link=recipe_url)
-            if list_item:
-                blocks.append(list_item)
-    
-    # Add wit and wisdom
-    if "Wit and Wisdom" in plant and plant["Wit and Wisdom"]:
-        heading_block = create_heading_block("Wit and Wisdom")
-        if heading_block:
-            blocks.append(heading_block)
+    Yields:
+        dict: Notion block or None
+    """
+    if section:
+        yield create_heading_block(heading)
+        yield create_rich_text_block(section)
+
+# Plant content sections in page order: (plant key, heading, block builder)
+_SECTION_BUILDERS = (
+    ("Planting", "Planting", _text_section_blocks),
+    ("Growing", "Growing", _text_section_blocks),
+    ("Harvesting", "Harvesting", _text_section_blocks),
+    ("Pests/Diseases", "Pests and Diseases", _table_section_blocks),
+    ("Recipes", "Recipes", _link_list_section_blocks),
+    ("Wit and Wisdom", "Wit and Wisdom", _paragraph_section_blocks),
+    ("Cooking Notes", "Cooking Notes", _paragraph_section_blocks)
+)
+
+def create_plant_content_blocks(plant, section_index=False):
+    """
+    Create Notion blocks for plant content.
+    
+    Args:
+        plant (dict): Plant data from plants_detailed.json
+        section_index (bool, optional): Also return where each section starts. Defaults to False.
         
-        content_block = create_rich_text_block(plant["Wit and Wisdom"])
-        if content_block:
-            blocks.append(content_block)
-    
-    # Add cooking notes
-    if "Cooking Notes" in plant and plant["Cooking Notes"]:
-        heading_block = create_heading_block("Cooking Notes")
-        if heading_block:
-            blocks.append(heading_block)
+    Returns:
+        list: Notion blocks, or a (blocks, section_index) tuple when section_index is True,
+              where section_index maps each section heading to the index of its block
+    """
+    blocks = [block for block in _iter_plant_content_blocks(plant) if block]
+    if not section_index:
+        return blocks
+    
+    return blocks, {
+        block["heading_2"]["rich_text"][0]["text"]["content"]: i
+        for i, block in enumerate(blocks)
+        if block["type"] == "heading_2"
+    }
+
+def _iter_plant_content_blocks(plant):
+    """
+    Yield Notion blocks for plant content, in page order.
+    
+    Blocks built from optional plant data may be None and are filtered by the caller.
+    
+    Args:
+        plant (dict): Plant data from plants_detailed.json
         
-        content_block = create_rich_text_block(plant["Cooking Notes"])
-        if content_block:
-            blocks.append(content_block)
+    Yields:
+        dict: Notion block or None
+    """
+    # Add plant image
+    if "Image URL" in plant and plant["Image URL"]:
+        yield create_image_block(plant["Image URL"])
     
-    return blocks
+    for key, heading, build_blocks in _SECTION_BUILDERS:
+        if key in plant:
+            yield from build_blocks(heading, plant[key])
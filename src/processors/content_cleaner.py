@@ -3,33 +3,250 @@ Content cleaning utilities for processing scraped data.
 """
 
 import re
+import functools
+import soupsieve as sv
 from bs4 import Tag
+from src import config
+
+# Links to recipe pages, matched by the CSS selector engine rather than in Python.
+# Compiled once so the selector isn't re-resolved for every field item.
+_RECIPE_LINK_SELECTOR = sv.compile('a[href*="/recipe/"]')
+
+# Whitespace that needs normalizing: runs of whitespace or anything but a plain space
+_MULTISPACE_RE = re.compile(r'\s{2,}|[^\S ]')
+
+# Variations of advertisement text left behind in scraped content
+_AD_TEXTS = ('ADVERTISEMENT', 'Advertisement')
+_AD_TEXT = '(?:' + '|'.join(_AD_TEXTS) + ')'
+# Lines holding only advertisement text, or starting with it, are dropped
+# entirely; indented ad text followed by more text leaves an empty line.
+# [^\S\n] is any whitespace but a newline, matching what str.strip() removes
+_AD_LINE_RE = re.compile(rf'^(?:[^\S\n]*{_AD_TEXT}[^\S\n]*|{_AD_TEXT}.*)(?:\n|$)', re.M)
+# Advertisement text later in a line truncates the rest of that line
+_AD_INLINE_RE = re.compile(rf'^[^\S\n]*(.*?)[^\S\n]*{_AD_TEXT}.*$', re.M)
+
+# Patterns that strongly indicate cooking instructions
+_COOKING_INDICATORS = [
+    r'\bcook\w*\b', r'\bprep\w*\b', r'\brecipe\w*\b', r'\beat\w*\b', r'\bfood\b',
+    r'\bdelicious\b', r'\btasty\b', r'\bflavor\w*\b', r'\bserve\w*\b', r'\bdish\w*\b',
+    r'\bmeal\w*\b', r'\bingredient\w*\b', r'\bboil\w*\b', r'\broast\w*\b', r'\bbake\w*\b',
+    r'\bsteam\w*\b', r'\bgrill\w*\b', r'\bfry\w*\b', r'\bsauté\w*\b', r'\bsaute\w*\b',
+    r'\bsimmer\w*\b', r'\bbroil\w*\b', r'\bheat\w*\b', r'\bwarm\w*\b', r'\bmicrowave\w*\b',
+    r'\btoast\w*\b', r'\bstir\w*\b', r'\bmix\w*\b', r'\bblend\w*\b', r'\bwhisk\w*\b',
+    r'\bchop\w*\b', r'\bdice\w*\b', r'\bslice\w*\b', r'\bmince\w*\b', r'\bgrate\w*\b',
+    r'\bpeel\w*\b', r'\bcut\w*\b', r'\btrim\w*\b', r'\bwash\w*\b', r'\brinse\w*\b',
+    r'\bdrain\w*\b', r'\bsoak\w*\b', r'\bmarinate\w*\b', r'\bseason\w*\b', r'\bsprinkle\w*\b',
+    r'\bdrizzle\w*\b', r'\bpour\w*\b', r'\bmeasure\w*\b', r'\bweigh\w*\b'
+]
+
+# Openers that mark a paragraph as a user comment/question when they start it
+_USER_COMMENT_OPENERS = [
+    'Hi', 'Hello', 'Thanks', 'Thank you',
+    'Why', 'How', 'What', 'Where', 'When',
+    'Who', 'Can', 'Do', 'Does', 'Is',
+    'Are', 'Will', 'Should', 'Could', 'Would'
+]
+
+# Patterns that strongly indicate user comments/questions anywhere in a paragraph
+_USER_COMMENT_INDICATORS = [
+    r'\bI\s', r'\bI\'', r'\bI\'ve\b', r'\bI\'m\b', r'\bI\'d\b', r'\bI\'ll\b',
+    r'\bmy\b', r'\bmine\b', r'\bwe\b', r'\bwe\'', r'\bwe\'ve\b', r'\bwe\'re\b',
+    r'\bwe\'d\b', r'\bwe\'ll\b', r'\bour\b', r'\bours\b'
+]
+
+# Topics that are clearly not cooking-related
+_NON_COOKING_TOPICS = [
+    r'\bpest\w*\b', r'\bdisease\w*\b', r'\binsect\w*\b', r'\bbeetle\w*\b', r'\bbug\w*\b',
+    r'\bgrub\w*\b', r'\bfertiliz\w*\b', r'\bsoil\b', r'\bplant\w*\b', r'\bgrow\w*\b',
+    r'\bgarden\w*\b', r'\byard\b', r'\blawn\b', r'\bseed\w*\b', r'\bsprout\w*\b',
+    r'\broot\w*\b', r'\bleaf\b', r'\bleaves\b', r'\bstem\w*\b', r'\bflower\w*\b',
+    r'\bbloom\w*\b', r'\bwater\w*\b', r'\birrigat\w*\b', r'\bsunlight\b', r'\bshade\b',
+    r'\btemperature\b', r'\bweather\b', r'\bseason\w*\b', r'\bspring\b', r'\bsummer\b',
+    r'\bfall\b', r'\bautumn\b', r'\bwinter\b', r'\bharvest\w*\b', r'\bduck\b', r'\bpet\b'
+]
+
+# Nutrition and health terms that are relevant to cooking
+_NUTRITION_TERMS = [
+    r'\bnutrient\w*\b', r'\bvitamin\w*\b', r'\bmineral\w*\b', r'\bprotein\b', 
+    r'\bfiber\b', r'\bhealth\w*\b', r'\bnutrition\w*\b', r'\bbeneficial\b', 
+    r'\bsuperfood\b', r'\bantioxidant\w*\b', r'\banti-inflammatory\b'
+]
+
+# Indicator patterns are a word boundary, a literal stem and a tail such as \w*\b
+_STEM_PATTERN_RE = re.compile(r"\\b((?:[^\\]|\\')+)(.*)")
+
+def _trie_to_regex(node):
+    """
+    Render a character trie of stems as a nested regex alternation.
+    
+    Stems that are covered by a shorter stem in the same trie are left out.
+    
+    Args:
+        node (dict): Trie node mapping characters to child nodes and '' to tails
+        
+    Returns:
+        str: Regex matching every stem and tail stored below the node
+    """
+    tails = node.get('', set())
+    children = {char: child for char, child in node.items() if char}
+    
+    # A stem that already matches with an empty tail makes longer stems redundant
+    if '' in tails:
+        return ''
+    # A \w*\b tail covers any continuation with word characters and a bare \b
+    if r'\w*\b' in tails:
+        tails = tails - {r'\b'}
+        children = {char: child for char, child in children.items() if not (char.isalnum() or char == '_')}
+    
+    alternatives = [re.escape(char) + _trie_to_regex(child) for char, child in sorted(children.items())]
+    alternatives += sorted(tails)
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return '(?:' + '|'.join(alternatives) + ')'
+
+def _compile_indicators(patterns):
+    """
+    Compile word-boundary indicator patterns into a single prefix-trie regex.
+    
+    Sharing stem prefixes means the engine tries one branch per leading letter at
+    each offset instead of every pattern, the same idea as an Aho-Corasick keyword
+    automaton. Patterns are lowercased and must be matched against lowercased text.
+    
+    Args:
+        patterns (list): Patterns of the form \\b<stem><tail>
+        
+    Returns:
+        re.Pattern: Compiled regex matching if any of the patterns would match
+    """
+    trie = {}
+    for pattern in patterns:
+        stem, tail = _STEM_PATTERN_RE.fullmatch(pattern.lower()).groups()
+        node = trie
+        for char in stem.replace('\\', ''):
+            node = node.setdefault(char, {})
+        node.setdefault('', set()).add(tail)
+    return re.compile(r'\b' + _trie_to_regex(trie))
+
+# Indicator lists merged by outcome: non-cooking topics and user comments both
+# reject a paragraph, cooking and nutrition terms both keep it
+_REJECT_RE = _compile_indicators(_NON_COOKING_TOPICS + _USER_COMMENT_INDICATORS)
+_KEEP_RE = _compile_indicators(_COOKING_INDICATORS + _NUTRITION_TERMS)
+# Openers are only tried at the start of a paragraph instead of at every offset
+_USER_COMMENT_OPENER_RE = re.compile(
+    (r'\s*(?:' + '|'.join(_USER_COMMENT_OPENERS) + r')\s').lower()
+)
 
 def clean_content(content):
     """
     Clean the content by removing extra whitespace and newlines.
     
+    Callers that know the type of their input can use clean_content_str or
+    clean_content_tag directly.
+    
     Args:
         content: Content to clean (string or BeautifulSoup element)
         
     Returns:
         str: Cleaned content
     """
-    if not content:
+    if isinstance(content, Tag):
+        return clean_content_tag(content)
+    return clean_content_str(content)
+
+def clean_content_tag(tag):
+    """
+    Clean the text of a BeautifulSoup element.
+    
+    Args:
+        tag (Tag): Element whose text should be cleaned
+        
+    Returns:
+        str: Cleaned content
+    """
+    return clean_content_str(tag.get_text(separator=" ", strip=True))
+
+@functools.lru_cache(maxsize=1024)
+def clean_content_str(text):
+    """
+    Clean a string by collapsing whitespace, memoized on the string.
+    
+    Args:
+        text (str): Text to clean
+        
+    Returns:
+        str: Text with single spaces and no surrounding whitespace
+    """
+    if not text:
         return ""
+    
+    # Already-normalized strings only need trimming
+    if not _MULTISPACE_RE.search(text):
+        return text.strip()
         
-    # If it's a BeautifulSoup element, get its text
-    if isinstance(content, Tag):
-        content = content.get_text(separator=" ", strip=True)
+    # Remove extra whitespace and newlines; split() already drops the ends
+    return ' '.join(text.split())
+
+def _is_rejected_paragraph(paragraph):
+    """
+    Check whether a stripped paragraph is a user comment or a non-cooking topic.
+    
+    Args:
+        paragraph (str): Lowercased paragraph with surrounding whitespace removed
         
-    # Remove extra whitespace and newlines
-    content = ' '.join(content.split())
-    return content.strip()
+    Returns:
+        bool: True if the paragraph should be filtered out
+    """
+    return bool(
+        paragraph.endswith('?')
+        or _USER_COMMENT_OPENER_RE.match(paragraph)
+        or _REJECT_RE.search(paragraph)
+    )
+
+@functools.lru_cache(maxsize=256)
+def _plant_exception_re(plant_name):
+    """
+    Compile the pattern for paragraphs about cooking a specific plant.
+    
+    Args:
+        plant_name (str): Name of the plant
+        
+    Returns:
+        re.Pattern: Lowercase pattern matching e.g. "cook kale" or "kale recipe"
+    """
+    name = re.escape(plant_name.lower())
+    return re.compile(rf'\b(?:cook|cooking|prepare|eat)\s+{name}\b|\b{name}\s+(?:recipe|dish)\b')
+
+def _is_cooking_paragraph(paragraph, exception_re=None):
+    """
+    Decide whether a stripped Cooking Notes paragraph should be kept.
+    
+    Args:
+        paragraph (str): Paragraph with surrounding whitespace removed
+        exception_re (re.Pattern, optional): Lowercase pattern for paragraphs about
+                                             cooking the plant, kept regardless of topic
+        
+    Returns:
+        bool: True if the paragraph reads like a cooking instruction
+    """
+    # Match against one lowercased copy, but keep the original text
+    lowered = paragraph.lower()
+    
+    # Skip non-cooking topics and user comments,
+    # but keep them if they specifically mention cooking the plant
+    if _is_rejected_paragraph(lowered):
+        return bool(exception_re and exception_re.search(lowered))
+    
+    # Keep paragraphs with strong cooking or nutrition indicators
+    return bool(_KEEP_RE.search(lowered))
 
+@functools.lru_cache(maxsize=2048)
 def filter_user_comments_from_cooking_notes(content, plant_name=None):
     """
     Filter out user comments from Cooking Notes content.
     
+    Results are memoized on (content, plant_name); call
+    filter_user_comments_from_cooking_notes.cache_clear() to reset.
+    
     Args:
         content (str): Cooking Notes content
         plant_name (str, optional): Name of the plant. If provided, will prioritize content
@@ -41,107 +258,32 @@ def filter_user_comments_from_cooking_notes(content, plant_name=None):
     if not content:
         return ""
     
+    # Split content into paragraphs
+    paragraphs = content.split('\n')
+    
     # Extract plant name from content if not provided
     if not plant_name:
         # Try to extract from first line or paragraph
-        first_paragraph = content.split('\n')[0]
-        words = first_paragraph.split()
+        words = paragraphs[0].split()
         if words:
             # Assume the first word might be the plant name
             plant_name = words[0].lower()
     
-    # Split content into paragraphs
-    paragraphs = content.split('\n')
+    # Paragraphs that specifically mention cooking the plant are kept regardless of topic
+    exception_re = _plant_exception_re(plant_name) if plant_name else None
     
-    # First pass: identify cooking instructions that mention the plant
-    cooking_instructions = []
-    
-    # Patterns that strongly indicate cooking instructions
-    cooking_indicators = [
-        r'\bcook\w*\b', r'\bprep\w*\b', r'\brecipe\w*\b', r'\beat\w*\b', r'\bfood\b',
-        r'\bdelicious\b', r'\btasty\b', r'\bflavor\w*\b', r'\bserve\w*\b', r'\bdish\w*\b',
-        r'\bmeal\w*\b', r'\bingredient\w*\b', r'\bboil\w*\b', r'\broast\w*\b', r'\bbake\w*\b',
-        r'\bsteam\w*\b', r'\bgrill\w*\b', r'\bfry\w*\b', r'\bsauté\w*\b', r'\bsaute\w*\b',
-        r'\bsimmer\w*\b', r'\bbroil\w*\b', r'\bheat\w*\b', r'\bwarm\w*\b', r'\bmicrowave\w*\b',
-        r'\btoast\w*\b', r'\bstir\w*\b', r'\bmix\w*\b', r'\bblend\w*\b', r'\bwhisk\w*\b',
-        r'\bchop\w*\b', r'\bdice\w*\b', r'\bslice\w*\b', r'\bmince\w*\b', r'\bgrate\w*\b',
-        r'\bpeel\w*\b', r'\bcut\w*\b', r'\btrim\w*\b', r'\bwash\w*\b', r'\brinse\w*\b',
-        r'\bdrain\w*\b', r'\bsoak\w*\b', r'\bmarinate\w*\b', r'\bseason\w*\b', r'\bsprinkle\w*\b',
-        r'\bdrizzle\w*\b', r'\bpour\w*\b', r'\bmeasure\w*\b', r'\bweigh\w*\b'
+    # Keep only non-empty paragraphs that read like cooking instructions
+    cooking_instructions = [
+        paragraph for paragraph in map(str.strip, paragraphs)
+        if paragraph and _is_cooking_paragraph(paragraph, exception_re)
     ]
     
-    # Patterns that strongly indicate user comments/questions
-    user_comment_indicators = [
-        r'\?\s*$',  # Ends with question mark
-        r'^\s*Hi\s', r'^\s*Hello\s', r'^\s*Thanks\s', r'^\s*Thank you\s',
-        r'^\s*Why\s', r'^\s*How\s', r'^\s*What\s', r'^\s*Where\s', r'^\s*When\s',
-        r'^\s*Who\s', r'^\s*Can\s', r'^\s*Do\s', r'^\s*Does\s', r'^\s*Is\s',
-        r'^\s*Are\s', r'^\s*Will\s', r'^\s*Should\s', r'^\s*Could\s', r'^\s*Would\s',
-        r'\bI\s', r'\bI\'', r'\bI\'ve\b', r'\bI\'m\b', r'\bI\'d\b', r'\bI\'ll\b',
-        r'\bmy\b', r'\bmine\b', r'\bwe\b', r'\bwe\'', r'\bwe\'ve\b', r'\bwe\'re\b',
-        r'\bwe\'d\b', r'\bwe\'ll\b', r'\bour\b', r'\bours\b'
-    ]
-    
-    # Topics that are clearly not cooking-related
-    non_cooking_topics = [
-        r'\bpest\w*\b', r'\bdisease\w*\b', r'\binsect\w*\b', r'\bbeetle\w*\b', r'\bbug\w*\b',
-        r'\bgrub\w*\b', r'\bfertiliz\w*\b', r'\bsoil\b', r'\bplant\w*\b', r'\bgrow\w*\b',
-        r'\bgarden\w*\b', r'\byard\b', r'\blawn\b', r'\bseed\w*\b', r'\bsprout\w*\b',
-        r'\broot\w*\b', r'\bleaf\b', r'\bleaves\b', r'\bstem\w*\b', r'\bflower\w*\b',
-        r'\bbloom\w*\b', r'\bwater\w*\b', r'\birrigat\w*\b', r'\bsunlight\b', r'\bshade\b',
-        r'\btemperature\b', r'\bweather\b', r'\bseason\w*\b', r'\bspring\b', r'\bsummer\b',
-        r'\bfall\b', r'\bautumn\b', r'\bwinter\b', r'\bharvest\w*\b', r'\bduck\b', r'\bpet\b'
-    ]
-    
-    # Nutrition and health terms that are relevant to cooking
-    nutrition_terms = [
-        r'\bnutrient\w*\b', r'\bvitamin\w*\b', r'\bmineral\w*\b', r'\bprotein\b', 
-        r'\bfiber\b', r'\bhealth\w*\b', r'\bnutrition\w*\b', r'\bbeneficial\b', 
-        r'\bsuperfood\b', r'\bantioxidant\w*\b', r'\banti-inflammatory\b'
-    ]
-    
-    for paragraph in paragraphs:
-        paragraph = paragraph.strip()
-        if not paragraph:
-            continue
-        
-        # Skip paragraphs that contain non-cooking topics
-        if any(re.search(pattern, paragraph, re.IGNORECASE) for pattern in non_cooking_topics):
-            # But keep if it specifically mentions cooking the plant
-            if plant_name and any(re.search(fr'\b{pattern}\b', paragraph, re.IGNORECASE) for pattern in [
-                f'cook {plant_name}', f'cooking {plant_name}', f'prepare {plant_name}', 
-                f'eat {plant_name}', f'{plant_name} recipe', f'{plant_name} dish'
-            ]):
-                cooking_instructions.append(paragraph)
-            continue
-            
-        # Skip paragraphs that are clearly user comments
-        if any(re.search(pattern, paragraph, re.IGNORECASE) for pattern in user_comment_indicators):
-            # But keep if it specifically mentions cooking the plant
-            if plant_name and any(re.search(fr'\b{pattern}\b', paragraph, re.IGNORECASE) for pattern in [
-                f'cook {plant_name}', f'cooking {plant_name}', f'prepare {plant_name}', 
-                f'eat {plant_name}', f'{plant_name} recipe', f'{plant_name} dish'
-            ]):
-                cooking_instructions.append(paragraph)
-            continue
-        
-        # Keep paragraphs with strong cooking indicators
-        if any(re.search(pattern, paragraph, re.IGNORECASE) for pattern in cooking_indicators):
-            cooking_instructions.append(paragraph)
-            continue
-            
-        # Keep paragraphs that are clearly about nutrition
-        if any(re.search(pattern, paragraph, re.IGNORECASE) for pattern in nutrition_terms):
-            cooking_instructions.append(paragraph)
-    
-    # Join filtered paragraphs back into a string
-    filtered_content = '\n'.join(cooking_instructions)
-    
     # If we filtered out everything, return a message
-    if not filtered_content.strip():
+    if not cooking_instructions:
         return "No cooking instructions available."
     
-    return filtered_content
+    # Join filtered paragraphs back into a string
+    return '\n'.join(cooking_instructions)
 
 def clean_advertisement_content(content):
     """
@@ -155,44 +297,34 @@ def clean_advertisement_content(content):
     """
     if not isinstance(content, str):
         return content
+    
+    return _clean_advertisement_text(content)
+
+@functools.lru_cache(maxsize=2048)
+def _clean_advertisement_text(content):
+    """
+    Remove advertisement text from a string, memoized on the string.
+    
+    Args:
+        content (str): Content to clean
         
+    Returns:
+        str: Cleaned content
+    """
     # Special handling for Cooking Notes section
     if "Cooking Notes" in content or "nutrient-dense" in content:  # Indicators for Cooking Notes
         # Filter out user comments from Cooking Notes
         return filter_user_comments_from_cooking_notes(content)
         
-    # Handle variations of advertisement text
-    ad_texts = ["ADVERTISEMENT", "Advertisement"]
-    
-    # First check if any ad text exists in the content
-    has_ad = any(ad_text in content for ad_text in ad_texts)
-    if not has_ad:
+    # First check if any ad text exists in the content; plain substring
+    # checks are cheaper than a regex scan for the common ad-free case
+    if not any(ad_text in content for ad_text in _AD_TEXTS):
         return content
     
-    # Split content by lines to handle multiple ad occurrences
-    lines = content.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        # Skip lines that contain only advertisement text
-        if any(line.strip() == ad_text for ad_text in ad_texts):
-            continue
-            
-        # For lines that contain ad text mixed with content, truncate at the ad text
-        ad_found = False
-        for ad_text in ad_texts:
-            if ad_text in line:
-                ad_index = line.find(ad_text)
-                if ad_index > 0:
-                    cleaned_lines.append(line[:ad_index].strip())
-                ad_found = True
-                break
-        
-        # If no ad text in this line, keep it
-        if not ad_found:
-            cleaned_lines.append(line)
-    
-    return '\n'.join(cleaned_lines).strip()
+    # Drop advertisement-only lines, then truncate lines at any remaining ad text
+    content = _AD_LINE_RE.sub('', content)
+    content = _AD_INLINE_RE.sub(r'\1', content)
+    return content.strip()
 
 def has_subheadings(item):
     """
@@ -207,7 +339,9 @@ def has_subheadings(item):
     if isinstance(item, str):
         return False  # String inputs cannot have h3 tags
     try:
-        return len(item.find_all('h3')) > 0
+        # Stop at the first h3 rather than collecting them all; a plain scan is
+        # faster than find('h3'), which loses bs4's tag-name fast path
+        return any(node.name == 'h3' for node in item.descendants)
     except AttributeError:
         return False  # Handle any other non-BeautifulSoup objects gracefully
 
@@ -221,14 +355,5 @@ def extract_recipe_links(field_item):
     Returns:
         dict: Dictionary mapping recipe names to URLs
     """
-    recipe_links = {}
-    links = field_item.find_all('a')
-    base_url = "https://www.almanac.com"
-    
-    for link in links:
-        if '/recipe/' in link.get('href', ''):
-            recipe_name = link.get_text(strip=True)
-            recipe_url = base_url + link.get('href')
-            recipe_links[recipe_name] = recipe_url
-    
-    return recipe_links
+    links = _RECIPE_LINK_SELECTOR.select(field_item)
+    return {link.get_text(strip=True): config.BASE_URL + link["href"] for link in links}
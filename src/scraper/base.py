@@ -3,8 +3,9 @@ Base scraper functionality for all scrapers.
 """
 
 import time
-from bs4 import Tag
-from src.utils.http import get_soup
+import httpx
+from bs4 import Tag, NavigableString
+from src.utils.http import get_soup, fetch_html, fetch_html_async, AdaptiveRateLimiter
 from src.processors.content_cleaner import clean_content, clean_advertisement_content
 from src import config
 
@@ -16,7 +17,7 @@ def extract_content_between_elements(start_elem, end_elem=None, stop_text=None,
         start_elem: The starting element
         end_elem: The ending element (optional)
         stop_text: Text to stop extraction at (optional)
-        special_handling: Function to handle special elements (optional)
+        special_handling: Function taking an element and returning (content, should_stop) (optional)
     
     Returns:
         Extracted content as string or structured data for tables
@@ -24,16 +25,25 @@ def extract_content_between_elements(start_elem, end_elem=None, stop_text=None,
     if not start_elem:
         return ""
         
+    parent = start_elem.parent
+    if parent is None:
+        return ""
+        
     content = []
     structured_data = None  # For storing table data
-    current_elem = start_elem.next_sibling
     
-    while current_elem and (end_elem is None or current_elem != end_elem):
+    # Walk the siblings by position; Tag.index compares by identity, so the stop
+    # check does not fall back to BeautifulSoup's structural equality
+    siblings = parent.contents
+    start_index = parent.index(start_elem) + 1
+    end_index = parent.index(end_elem) if end_elem is not None and end_elem.parent is parent else len(siblings)
+    
+    for current_elem in siblings[start_index:end_index]:
         if isinstance(current_elem, Tag):
             if current_elem.name != 'h3':  # Skip any nested h3
                 if special_handling:
                     # Special handling returned content, use it
-                    special_content, should_stop = special_handling(current_elem, "".join(content) if content else "")
+                    special_content, should_stop = special_handling(current_elem)
                     
                     # If we got structured data (like a table), store it separately
                     if special_content and isinstance(special_content, dict) and "headers" in special_content and "rows" in special_content:
@@ -63,12 +73,6 @@ def extract_content_between_elements(start_elem, end_elem=None, stop_text=None,
                             break
                         elif text_content:
                             content.append(text_content)
-        
-        current_elem = current_elem.next_sibling
-        
-        # If we've reached the end element, stop
-        if end_elem is not None and current_elem == end_elem:
-            break
     
     # Return structured data if we found a table, otherwise join content as string
     if structured_data:
@@ -76,6 +80,31 @@ def extract_content_between_elements(start_elem, end_elem=None, stop_text=None,
     else:
         return " ".join(content).strip()
 
+def _is_pest_table(table_tag):
+    """
+    Check whether a table is a Pests/Diseases table.
+    
+    The caption and the "Pest/Disease" header text are checked in a single walk
+    over the table instead of one search for each.
+    
+    Args:
+        table_tag: BeautifulSoup table element
+        
+    Returns:
+        bool: True if the first caption mentions pests and diseases or any
+              string in the table contains "Pest/Disease"
+    """
+    caption_seen = False
+    for node in table_tag.descendants:
+        if isinstance(node, NavigableString):
+            if "Pest/Disease" in node:
+                return True
+        elif node.name == 'caption' and not caption_seen:
+            caption_seen = True
+            if "Pests and Diseases" in node.get_text():
+                return True
+    return False
+
 def process_table(table_tag):
     """
     Process a table tag and return a structured format with headers and rows.
@@ -87,17 +116,7 @@ def process_table(table_tag):
     Returns:
         dict: Dictionary with headers and rows
     """
-    # Check if this is a pests/diseases table by looking for the caption or headers
-    is_pest_table = False
-    caption = table_tag.find('caption')
-    if caption and "Pests and Diseases" in caption.get_text():
-        is_pest_table = True
-    
-    # Also check headers for "Pest/Disease" column
-    if table_tag.find(string=lambda text: text and "Pest/Disease" in text):
-        is_pest_table = True
-    
-    if is_pest_table:
+    if _is_pest_table(table_tag):
         # This is a pests/diseases table
         # First, extract the column headers from the thead section
         thead = table_tag.find('thead')
@@ -174,13 +193,12 @@ def process_table(table_tag):
             "rows": processed_rows
         }
 
-def handle_special_elements(elem, content):
+def handle_special_elements(elem):
     """
     Handle special elements like tables.
     
     Args:
         elem: BeautifulSoup element to handle
-        content: Current content string
         
     Returns:
         tuple: (processed_content, should_stop)
@@ -194,6 +212,8 @@ def handle_special_elements(elem, content):
 class BaseScraper:
     """Base class for all scrapers."""
     
+    __slots__ = ('headers', 'timeout', 'verify', 'delay', 'rate_limiter', '_async_client')
+    
     def __init__(self, headers=None, timeout=None, verify=None, delay=None):
         """
         Initialize the scraper.
@@ -208,18 +228,65 @@ class BaseScraper:
         self.timeout = timeout or config.REQUEST_TIMEOUT
         self.verify = config.VERIFY_SSL if verify is None else verify
         self.delay = delay or config.REQUEST_DELAY
+        self.rate_limiter = AdaptiveRateLimiter(self.delay)
+        self._async_client = None
     
-    def get_soup(self, url):
+    def get_soup(self, url, parse_only=None):
         """
         Get BeautifulSoup object from URL.
         
         Args:
             url (str): URL to request
+            parse_only (SoupStrainer, optional): Only build the parts of the page it matches
             
         Returns:
             BeautifulSoup: Parsed HTML content or None if request failed
         """
-        return get_soup(url, self.headers, self.timeout, self.verify)
+        return get_soup(url, self.headers, self.timeout, self.verify, parse_only=parse_only)
+    
+    def fetch_html(self, url):
+        """
+        Fetch the raw HTML of a URL, paced by the scraper's rate limiter.
+        
+        Args:
+            url (str): URL to request
+            
+        Returns:
+            bytes: Response body or None if request failed
+        """
+        return fetch_html(url, self.headers, self.timeout, self.verify, rate_limiter=self.rate_limiter)
+    
+    def _get_async_client(self):
+        """Create the async client on first use and reuse it for later requests."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self.headers,
+                verify=self.verify,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=config.CONCURRENCY)
+            )
+        return self._async_client
+    
+    async def fetch_html_async(self, url):
+        """
+        Fetch the raw HTML of a URL without blocking the event loop, paced by the
+        scraper's rate limiter.
+        
+        Args:
+            url (str): URL to request
+            
+        Returns:
+            bytes: Response body or None if request failed
+        """
+        return await fetch_html_async(
+            self._get_async_client(), url, self.timeout, rate_limiter=self.rate_limiter
+        )
+    
+    async def aclose(self):
+        """Close the async HTTP client if one was opened."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def scrape(self, url):
         """
@@ -248,3 +315,4 @@ class BaseScraper:
     def sleep(self):
         """Sleep between requests to be polite to the server."""
         time.sleep(self.delay)
+
@@ -5,20 +5,39 @@ Plant details scraper for extracting detailed plant information.
 import os
 import time
 import json
-from bs4 import Tag
+import asyncio
+import logging
+import functools
+import soupsieve as sv
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import Tag, SoupStrainer
 from src.scraper.base import BaseScraper, extract_content_between_elements, handle_special_elements
 from src.processors.content_cleaner import (
-    clean_content, 
+    clean_content_tag, 
     clean_advertisement_content, 
     has_subheadings,
     extract_recipe_links
 )
-from src.utils.file_io import load_from_csv, save_to_json
+from src.utils.file_io import load_rows_from_csv, save_to_json, save_to_ndjson
+from src.utils.http import parse_html_section, AdaptiveRateLimiter
 from src import config
 
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Only the main content block of a plant page is parsed
+CONTENT_SELECTOR = "#block-almanaco-content"
+CONTENT_STRAINER = SoupStrainer(id="block-almanaco-content")
+CONTENT_BLOCK_SELECTOR = sv.compile(CONTENT_SELECTOR)  # compiled once for every page
+
+# Fields already filled in from the plants CSV
+BASIC_FIELDS = frozenset(("Name", "Link", "Image URL"))
+
 class PlantDetailsScraper(BaseScraper):
     """Scraper for extracting detailed plant information."""
     
+    __slots__ = ('plants_csv',)
+    
     def __init__(self, plants_csv=None, **kwargs):
         """
         Initialize the plant details scraper.
@@ -34,6 +53,10 @@ class PlantDetailsScraper(BaseScraper):
         """
         Scrape details for all plants in the CSV file.
         
+        Requests are paced by the scraper's rate limiter, which backs off when the
+        server throttles or errors. Each plant is appended to the checkpoint file
+        as soon as it is scraped; the full JSON file is written once when the run ends.
+        
         Args:
             limit (int, optional): Maximum number of plants to scrape. Defaults to None (all plants).
             
@@ -41,28 +64,25 @@ class PlantDetailsScraper(BaseScraper):
             list: List of plant details dictionaries
         """
         # Load the plants list
-        df = load_from_csv(self.plants_csv)
-        if df is None:
+        rows = load_rows_from_csv(self.plants_csv)
+        if rows is None:
             return None
         
         # Limit the number of plants if specified
         if limit:
-            df = df.head(limit)
+            rows = rows[:limit]
         
         all_plants = []
-        total_count = len(df)
+        total_count = len(rows)
+        self.reset_checkpoint()
         
         try:
-            for index, row in df.iterrows():
+            for index, row in enumerate(rows):
                 try:
                     plant_data = self.scrape_plant(row, index, total_count)
                     if plant_data:
                         all_plants.append(plant_data)
-                        # Save progress every 10 plants
-                        if (index + 1) % 10 == 0:
-                            self.save_progress(all_plants)
-                    
-                    self.sleep()  # Be polite to their servers
+                        self.checkpoint(plant_data)
                     
                 except KeyboardInterrupt:
                     raise
@@ -81,13 +101,67 @@ class PlantDetailsScraper(BaseScraper):
         
         return all_plants
     
+    async def scrape_all_async(self, limit=None):
+        """
+        Scrape details for all plants in the CSV file using asyncio.
+        
+        One task is started per plant, with at most config.CONCURRENCY requests in
+        flight at a time. Request starts are spread evenly at config.CONCURRENCY
+        times the sequential rate, backing off while the server throttles or errors.
+        Pages are parsed in a pool of config.PARSE_WORKERS processes while the
+        event loop keeps fetching.
+        
+        Args:
+            limit (int, optional): Maximum number of plants to scrape. Defaults to None (all plants).
+            
+        Returns:
+            list: List of plant details dictionaries
+        """
+        # Load the plants list
+        rows = load_rows_from_csv(self.plants_csv)
+        if rows is None:
+            return None
+        
+        # Limit the number of plants if specified
+        if limit:
+            rows = rows[:limit]
+        
+        total_count = len(rows)
+        semaphore = asyncio.Semaphore(config.CONCURRENCY)
+        self.reset_checkpoint()
+        
+        async def scrape_row(row, index):
+            async with semaphore:
+                plant_data = await self.scrape_plant_async(row, index, total_count, executor)
+            if plant_data:
+                self.checkpoint(plant_data)
+            return plant_data
+        
+        # Pace this run with its own limiter, leaving the sequential one untouched
+        sequential_rate_limiter = self.rate_limiter
+        self.rate_limiter = AdaptiveRateLimiter(self.delay / config.CONCURRENCY)
+        try:
+            with ProcessPoolExecutor(max_workers=config.PARSE_WORKERS) as executor:
+                results = await asyncio.gather(
+                    *(scrape_row(row, index) for index, row in enumerate(rows))
+                )
+        finally:
+            self.rate_limiter = sequential_rate_limiter
+            await self.aclose()
+        
+        all_plants = [plant_data for plant_data in results if plant_data]
+        if all_plants:
+            self.save_progress(all_plants)
+        
+        return all_plants
+    
     def scrape_plant(self, row, index, total_count):
         """
         Scrape details for a single plant.
         
         Args:
-            row: DataFrame row with plant basic information
-            index: Index of the plant in the DataFrame
+            row (dict): CSV row with plant basic information
+            index: Index of the plant in the CSV file
             total_count: Total number of plants
             
         Returns:
@@ -101,50 +175,122 @@ class PlantDetailsScraper(BaseScraper):
 
             print(f"[{index+1}/{total_count}] Scraping {name}...")
 
-            # Get the soup
-            soup = self.get_soup(link)
-            if not soup:
+            # Get the raw page
+            html = self.fetch_html(link)
+            if html is None:
                 print(f"  ⚠️ Failed to get soup for {name}")
                 return None
             
-            # Initialize plant data with basic fields
-            plant_data = {
-                "Name": name,
-                "Link": link,
-                "Image URL": image
-            }
+            return self.parse_plant_html(html, name, link, image)
             
-            # Get content blocks
-            content_blocks = soup.select("#block-almanaco-content")
-            if not content_blocks:
-                print(f"  ⚠️ No content blocks found for {name}")
-                return None
-                
-            # Extract data from content blocks
-            field_items = {}  # Collect all field items first
-            current_label = None
-            
-            for block in content_blocks:
-                for child in block.descendants:
-                    if isinstance(child, Tag):
-                        if 'field__label' in child.get('class', []):
-                            current_label = child.get_text(strip=True)
-                            if current_label and current_label not in ["Name", "Link", "Image URL"]:  # Skip basic fields
-                                field_items[current_label] = []
-                        elif current_label and 'field__item' in child.get('class', []):
-                            if current_label not in ["Name", "Link", "Image URL"]:  # Skip basic fields
-                                field_items[current_label].append(child)
+        except Exception as e:
+            print(f"  ❌ Error processing {name}: {str(e)}")
+            return None
+    
+    async def scrape_plant_async(self, row, index, total_count, executor=None):
+        """
+        Scrape details for a single plant without blocking the event loop.
+        
+        The page is fetched asynchronously, then parsed and cleaned in the executor
+        so other fetches can proceed meanwhile.
+        
+        Args:
+            row (dict): CSV row with plant basic information
+            index: Index of the plant in the CSV file
+            total_count: Total number of plants
+            executor (Executor, optional): Executor to parse the page in. Defaults to
+                                           None (the event loop's default thread pool).
             
-            # Process the field items
-            processed_data = self.process_field_items(field_items)
-            plant_data.update(processed_data)
+        Returns:
+            dict: Plant details dictionary or None if scraping failed
+        """
+        try:
+            name = row["Name"]
+            link = row["Link"]
+            image = row["Image URL"]
+
+            print(f"[{index+1}/{total_count}] Scraping {name}...")
+
+            # Get the raw page; building the soup happens off the event loop
+            html = await self.fetch_html_async(link)
+            if html is None:
+                print(f"  ⚠️ Failed to get soup for {name}")
+                return None
             
-            return plant_data
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, parse_plant_html, html, name, link, image)
             
         except Exception as e:
             print(f"  ❌ Error processing {name}: {str(e)}")
             return None
     
+    def parse_plant_html(self, html, name, link, image):
+        """
+        Parse the raw HTML of a plant page.
+        
+        Args:
+            html (bytes): Page content
+            name (str): Plant name
+            link (str): Plant page URL
+            image (str): Plant image URL
+            
+        Returns:
+            dict: Plant details dictionary
+        """
+        soup = parse_html_section(html, CONTENT_SELECTOR, CONTENT_STRAINER)
+        return self.parse_plant_page(soup, name, link, image)
+    
+    def parse_plant_page(self, soup, name, link, image):
+        """
+        Extract plant details from a parsed plant page.
+        
+        Args:
+            soup: BeautifulSoup object of the plant page
+            name (str): Plant name
+            link (str): Plant page URL
+            image (str): Plant image URL
+            
+        Returns:
+            dict: Plant details dictionary or None if the page has no content
+        """
+        # Initialize plant data with basic fields
+        plant_data = {
+            "Name": name,
+            "Link": link,
+            "Image URL": image
+        }
+        
+        # Get content blocks
+        content_blocks = CONTENT_BLOCK_SELECTOR.select(soup)
+        if not content_blocks:
+            print(f"  ⚠️ No content blocks found for {name}")
+            return None
+            
+        # Extract data from content blocks
+        field_items = {}  # Collect all field items first
+        current_label = None
+        
+        for block in content_blocks:
+            # find_all(True) yields only tags, in document order, so each item
+            # belongs to the label that most recently preceded it
+            for child in block.find_all(True):
+                classes = child.get('class')
+                if not classes:
+                    continue
+                if 'field__label' in classes:
+                    current_label = child.get_text(strip=True)
+                    if current_label and current_label not in BASIC_FIELDS:  # Skip basic fields
+                        field_items[current_label] = []
+                elif current_label and 'field__item' in classes:
+                    if current_label not in BASIC_FIELDS:  # Skip basic fields
+                        field_items[current_label].append(child)
+        
+        # Process the field items
+        processed_data = self.process_field_items(field_items)
+        plant_data.update(processed_data)
+        
+        return plant_data
+    
     def process_field_items(self, field_items):
         """
         Process field items extracted from the plant page.
@@ -159,7 +305,7 @@ class PlantDetailsScraper(BaseScraper):
         
         # Process each field
         for field_name, items in field_items.items():
-            print(f"  Processing field: {field_name}")
+            logger.debug("Processing field: %s", field_name)
             if not items:
                 continue
                 
@@ -176,12 +322,11 @@ class PlantDetailsScraper(BaseScraper):
             # Special handling for Pests/Diseases section to preserve table structure
             if field_name == "Pests/Diseases":
                 for item in items:
-                    # Look for tables in the item
-                    tables = item.find_all('table')
-                    if tables:
-                        # Process the first table found
+                    # Look for the first table in the item
+                    table = item.find('table')
+                    if table is not None:
                         from src.scraper.base import process_table
-                        table_data = process_table(tables[0])
+                        table_data = process_table(table)
                         processed_data[field_name] = table_data
                         break
                 # If we processed a table, continue to next field
@@ -204,7 +349,7 @@ class PlantDetailsScraper(BaseScraper):
                         if "sub_headings" in result:
                             sub_headings.update(result["sub_headings"])
                 else:
-                    content = clean_content(item.get_text(separator=" ", strip=True))
+                    content = clean_content_tag(item)
                     if content:
                         if not field_content:
                             field_content = content
@@ -244,7 +389,7 @@ class PlantDetailsScraper(BaseScraper):
             dict: Dictionary with content and sub_headings
         """
         if not field_item:
-            print(f"  Debug: {current_label} - field_item is None")
+            logger.debug("%s - field_item is None", current_label)
             return {"content": "", "sub_headings": {}}
             
         result = {
@@ -263,7 +408,7 @@ class PlantDetailsScraper(BaseScraper):
         
         # Find all h3 tags
         h3_tags = field_item.find_all('h3')
-        print(f"  Debug: {current_label} - Found {len(h3_tags)} h3 tags")
+        logger.debug("%s - Found %d h3 tags", current_label, len(h3_tags))
         
         if not h3_tags:
             # No h3 tags, get all text content including lists
@@ -280,33 +425,33 @@ class PlantDetailsScraper(BaseScraper):
                             content_parts.append(text)
             
             result["content"] = " ".join(content_parts)
-            print(f"  Debug: {current_label} - No h3 tags, content length: {len(result['content'])}")
+            logger.debug("%s - No h3 tags, content length: %d", current_label, len(result["content"]))
             return result
         
         # Process content before the first h3 tag
         first_h3 = h3_tags[0]
         content_before_h3 = []
         
-        # Get content before the first h3, including lists
-        for elem in first_h3.previous_siblings:
-            if isinstance(elem, Tag):
-                if elem.name in ['ul', 'ol']:
-                    for li in elem.find_all('li', recursive=True):
-                        content_before_h3.insert(0, li.get_text(strip=True))
-                else:
-                    text = elem.get_text(separator=" ", strip=True)
-                    if text:
-                        content_before_h3.insert(0, text)
+        # Get content before the first h3, including lists. Siblings are walked
+        # backwards, so collect in reverse and flip once at the end.
+        for elem in first_h3.find_previous_siblings():
+            if elem.name in ['ul', 'ol']:
+                for li in elem.find_all('li', recursive=True):
+                    content_before_h3.append(li.get_text(strip=True))
+            else:
+                text = elem.get_text(separator=" ", strip=True)
+                if text:
+                    content_before_h3.append(text)
         
         if content_before_h3:
-            result["content"] = " ".join(content_before_h3)
-            print(f"  Debug: {current_label} - Content before h3 length: {len(result['content'])}")
+            result["content"] = " ".join(reversed(content_before_h3))
+            logger.debug("%s - Content before h3 length: %d", current_label, len(result["content"]))
         
         # Process each h3 and its content
         for i, h3 in enumerate(h3_tags):
             sub_heading = h3.get_text(strip=True)
             if not sub_heading:
-                print(f"  Debug: {current_label} - Empty subheading at index {i}")
+                logger.debug("%s - Empty subheading at index %d", current_label, i)
                 continue
                 
             # Determine special handling based on the label
@@ -326,10 +471,37 @@ class PlantDetailsScraper(BaseScraper):
             
             if content_after_h3:
                 result["sub_headings"][sub_heading] = content_after_h3
-                print(f"  Debug: {current_label} - Added subheading '{sub_heading}' with content length: {len(str(content_after_h3))}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s - Added subheading '%s' with content length: %d",
+                                 current_label, sub_heading, len(str(content_after_h3)))
         
         return result
     
+    def reset_checkpoint(self, filepath=None):
+        """
+        Start a new checkpoint file for this run.
+        
+        Args:
+            filepath (str, optional): Path to the NDJSON file. Defaults to config.PLANTS_PROGRESS_NDJSON.
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return save_to_ndjson([], filepath)
+    
+    def checkpoint(self, plant_data, filepath=None):
+        """
+        Append a scraped plant to the checkpoint file.
+        
+        Args:
+            plant_data (dict): Plant details dictionary
+            filepath (str, optional): Path to the NDJSON file. Defaults to config.PLANTS_PROGRESS_NDJSON.
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return save_to_ndjson([plant_data], filepath, append=True)
+    
     def save_progress(self, plants, filepath=None):
         """
         Save progress to a JSON file.
@@ -347,6 +519,29 @@ class PlantDetailsScraper(BaseScraper):
             print(f"\n💾 Progress saved: {len(plants)} plants")
         return result
 
+@functools.lru_cache(maxsize=1)
+def _page_parser():
+    """Scraper instance used for parsing, created once per (worker) process."""
+    return PlantDetailsScraper()
+
+def parse_plant_html(html, name, link, image):
+    """
+    Parse the raw HTML of a plant page.
+    
+    Module-level and taking only bytes and strings, so it can be sent to a
+    worker process.
+    
+    Args:
+        html (bytes): Page content
+        name (str): Plant name
+        link (str): Plant page URL
+        image (str): Plant image URL
+        
+    Returns:
+        dict: Plant details dictionary
+    """
+    return _page_parser().parse_plant_html(html, name, link, image)
+
 def main():
     """Main function to run the scraper."""
     scraper = PlantDetailsScraper()
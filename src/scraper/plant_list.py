@@ -2,15 +2,31 @@
 Plant list scraper for extracting basic plant information.
 """
 
-from bs4 import BeautifulSoup
+import re
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 from src.scraper.base import BaseScraper
-from src.utils.file_io import save_to_csv
+from src.utils.file_io import save_to_csv, save_to_csv_streaming
 from src import config
 
+# Only the plant grid items of the list page are parsed. While parsing, the strainer
+# sees the raw class attribute, so match the class as a token to allow extra classes.
+GRID_ITEM_STRAINER = SoupStrainer("div", class_=re.compile(r"(?:^|\s)views-view-grid__item(?:\s|$)"))
+
+# Selectors compiled once instead of on every select call
+GRID_ITEM_SELECTOR = sv.compile("div.views-view-grid__item")
+TITLE_SELECTOR = sv.compile("h3 a")
+IMAGE_SELECTOR = sv.compile("img")
+
+# Columns of the plants CSV
+PLANT_FIELDS = ["Name", "Link", "Image URL"]
+
 class PlantListScraper(BaseScraper):
     """Scraper for extracting basic plant information from the grid page."""
     
+    __slots__ = ('url',)
+    
     def __init__(self, url=None, **kwargs):
         """
         Initialize the plant list scraper.
@@ -29,26 +45,59 @@ class PlantListScraper(BaseScraper):
         Returns:
             list: List of plant dictionaries or None if scraping failed
         """
+        soup = self._get_list_soup()
+        if soup is None:
+            return None
+        
+        plants = list(self._iter_plant_items(soup))
+        print(f"✅ Extracted data for {len(plants)} plants")
+        return plants
+    
+    def iter_plants(self):
+        """
+        Scrape the plant list page, yielding plants as they are extracted.
+        
+        Yields:
+            dict: Plant data dictionary
+        """
+        soup = self._get_list_soup()
+        if soup is not None:
+            yield from self._iter_plant_items(soup)
+    
+    def _get_list_soup(self):
+        """
+        Get the grid of plant items from the plant list page.
+        
+        Returns:
+            BeautifulSoup: Parsed grid items or None if the request failed
+        """
         print(f"Scraping plant list from {self.url}")
         
         # Get the soup
-        soup = self.get_soup(self.url)
+        soup = self.get_soup(self.url, parse_only=GRID_ITEM_STRAINER)
         if not soup:
             print(f"❌ Failed to get soup for {self.url}")
             return None
+        return soup
+    
+    def _iter_plant_items(self, soup):
+        """
+        Extract plants from the grid items of the plant list page.
         
+        Args:
+            soup: BeautifulSoup object holding the grid items
+            
+        Yields:
+            dict: Plant data dictionary
+        """
         # Extract plant items
-        plants = []
-        plant_items = soup.select("div.views-view-grid__item")
+        plant_items = GRID_ITEM_SELECTOR.select(soup)
         print(f"Found {len(plant_items)} plant items")
         
         for item in plant_items:
             plant_data = self._extract_plant_data(item)
             if plant_data:
-                plants.append(plant_data)
-        
-        print(f"✅ Extracted data for {len(plants)} plants")
-        return plants
+                yield plant_data
     
     def _extract_plant_data(self, item):
         """
@@ -60,7 +109,7 @@ class PlantListScraper(BaseScraper):
         Returns:
             dict: Plant data dictionary or None if extraction failed
         """
-        title_elem = item.select_one("h3 a")
+        title_elem = TITLE_SELECTOR.select_one(item)
         if not title_elem:
             return None
         
@@ -68,7 +117,7 @@ class PlantListScraper(BaseScraper):
         link = config.BASE_URL + title_elem["href"]
         
         # Get image URL
-        img_elem = item.select_one("img")
+        img_elem = IMAGE_SELECTOR.select_one(item)
         img_path = img_elem.get("src") or img_elem.get("data-src", "") if img_elem else ""
         img_url = config.BASE_URL + img_path if img_path.startswith("/") else img_path
         
@@ -90,15 +139,24 @@ class PlantListScraper(BaseScraper):
             bool: True if successful, False otherwise
         """
         return save_to_csv(plants, filepath)
+    
+    def scrape_to_csv(self, filepath=None):
+        """
+        Scrape the plant list page straight into a CSV file.
+        
+        Args:
+            filepath (str, optional): Path to save the CSV file. Defaults to config.PLANTS_CSV.
+            
+        Returns:
+            int: Number of plants saved, or None if saving failed
+        """
+        return save_to_csv_streaming(self.iter_plants(), filepath, PLANT_FIELDS)
 
 def main():
     """Main function to run the scraper."""
     scraper = PlantListScraper()
-    plants = scraper.scrape()
     
-    if plants:
-        scraper.save_to_csv(plants)
-    else:
+    if not scraper.scrape_to_csv():
         print("❌ No plants were successfully scraped")
 
 if __name__ == "__main__":
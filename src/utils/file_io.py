@@ -3,10 +3,30 @@ File I/O utility functions for reading and writing data.
 """
 
 import os
+import csv
+import gzip
 import json
 import pandas as pd
 from src import config
 
+try:
+    import orjson
+    # numpy scalars (e.g. from DataFrame rows) are serialized natively, and
+    # non-string keys are stringified like json.dump does
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+# Without orjson, prefer ujson: it is a drop-in for json.dump/json.load and
+# still parses several times faster. Installing orjson takes over both.
+try:
+    import ujson as _json_impl
+    # ujson escapes "/" by default, which json.dump does not
+    _JSON_DUMP_OPTIONS = {"escape_forward_slashes": False}
+except ImportError:
+    _json_impl = json
+    _JSON_DUMP_OPTIONS = {}
+
 def ensure_directory_exists(directory):
     """
     Ensure a directory exists, creating it if necessary.
@@ -16,14 +36,36 @@ def ensure_directory_exists(directory):
     """
     os.makedirs(directory, exist_ok=True)
 
-def save_to_csv(data, filepath=None, index=False):
+def _read_csv_header(filepath):
+    """
+    Read the header row of an existing CSV file.
+    
+    Args:
+        filepath (str): Path to the CSV file
+        
+    Returns:
+        list: Column names, or None if the file is missing or empty
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            return next(csv.reader(f), None)
+    except FileNotFoundError:
+        return None
+
+def save_to_csv(data, filepath=None, index=False, *, chunksize=None, append=False):
     """
     Save data to a CSV file.
     
+    Appending lets a long scrape write each batch as it finishes instead of
+    keeping every row in memory until the end. The header is only written when
+    the file is new or empty, and appended lists follow the existing columns.
+    
     Args:
         data (list or DataFrame): Data to save
         filepath (str, optional): Path to save the file. Defaults to config.PLANTS_CSV.
         index (bool, optional): Whether to include index in CSV. Defaults to False.
+        chunksize (int, optional): Rows per write when saving a DataFrame. Defaults to None (all at once).
+        append (bool, optional): Append to the file instead of overwriting it. Defaults to False.
         
     Returns:
         bool: True if successful, False otherwise
@@ -34,47 +76,219 @@ def save_to_csv(data, filepath=None, index=False):
         # Ensure the directory exists
         ensure_directory_exists(os.path.dirname(filepath))
         
-        # Convert to DataFrame if it's a list
+        existing_header = _read_csv_header(filepath) if append else None
+        
+        # Write lists of dicts directly instead of building a DataFrame first
         if isinstance(data, list):
-            df = pd.DataFrame(data)
-        else:
-            df = data
-            
+            fieldnames = existing_header or list(dict.fromkeys(key for row in data for key in row))
+            with open(filepath, 'a' if append else 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+                if not existing_header:
+                    writer.writeheader()
+                writer.writerows(data)
+            print(f"✅ Saved {len(data)} rows to {filepath}")
+            return True
+        
         # Save to CSV
-        df.to_csv(filepath, index=index)
-        print(f"✅ Saved {len(df)} rows to {filepath}")
+        data.to_csv(filepath, index=index, mode='a' if append else 'w',
+                    header=not existing_header, chunksize=chunksize)
+        print(f"✅ Saved {len(data)} rows to {filepath}")
+        return True
+    except Exception as e:
+        print(f"❌ Error saving to CSV: {str(e)}")
+        return False
+
+def append_row_to_csv(row, filepath=None):
+    """
+    Append a single row to a CSV file, writing the header first if the file is new.
+    
+    Args:
+        row (dict): Row to append; keys missing from an existing header are rejected
+        filepath (str, optional): Path to the file. Defaults to config.PLANTS_CSV.
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    filepath = filepath or config.PLANTS_CSV
+    
+    try:
+        # Ensure the directory exists
+        ensure_directory_exists(os.path.dirname(filepath))
+        
+        existing_header = _read_csv_header(filepath)
+        with open(filepath, 'a', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=existing_header or list(row), lineterminator="\n")
+            if not existing_header:
+                writer.writeheader()
+            writer.writerow(row)
         return True
     except Exception as e:
         print(f"❌ Error saving to CSV: {str(e)}")
         return False
 
+def save_to_csv_streaming(rows, filepath=None, fieldnames=None):
+    """
+    Save rows to a CSV file as they are produced.
+    
+    Rows are written one at a time, so the full list never has to be held in
+    memory. They go to a temporary file next to the target, which only replaces
+    it once every row has been written, so an empty or failed run leaves any
+    existing file untouched.
+    
+    Args:
+        rows (iterable): Row dictionaries, e.g. from a generator
+        filepath (str, optional): Path to save the file. Defaults to config.PLANTS_CSV.
+        fieldnames (list, optional): Column names. Defaults to the keys of the first row.
+        
+    Returns:
+        int: Number of rows saved, or None if saving failed
+    """
+    filepath = filepath or config.PLANTS_CSV
+    rows = iter(rows)
+    
+    try:
+        first_row = next(rows, None)
+        if first_row is None:
+            print(f"⚠️ No rows to save to {filepath}")
+            return 0
+        
+        # Ensure the directory exists
+        ensure_directory_exists(os.path.dirname(filepath))
+        
+        tmp_filepath = filepath + '.tmp'
+        try:
+            with open(tmp_filepath, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames or list(first_row), lineterminator="\n")
+                writer.writeheader()
+                writer.writerow(first_row)
+                count = 1
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+            os.replace(tmp_filepath, filepath)
+        finally:
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+        print(f"✅ Saved {count} rows to {filepath}")
+        return count
+    except Exception as e:
+        print(f"❌ Error saving to CSV: {str(e)}")
+        return None
+
 def save_to_json(data, filepath=None, indent=2):
     """
     Save data to a JSON file.
     
+    Uses orjson when it is installed, which serializes straight to UTF-8 bytes
+    several times faster than the json module. orjson only supports two-space
+    indentation, so other indent levels fall back to ujson or json. Paths ending in
+    .json.gz are written compressed with save_to_json_gz.
+    
     Args:
         data (dict or list): Data to save
         filepath (str, optional): Path to save the file. Defaults to config.PLANTS_DETAILED_JSON.
-        indent (int, optional): JSON indentation level. Defaults to 2.
+        indent (int, optional): JSON indentation level, or None for compact output. Defaults to 2.
         
     Returns:
         bool: True if successful, False otherwise
     """
     filepath = filepath or config.PLANTS_DETAILED_JSON
+    if filepath.endswith('.json.gz'):
+        return save_to_json_gz(data, filepath)
     
     try:
         # Ensure the directory exists
         ensure_directory_exists(os.path.dirname(filepath))
         
         # Save to JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        if orjson is not None and indent in (None, 0, 2):
+            options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=options))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                # ujson only takes an integer indent, where 0 means compact output
+                if indent is None and _json_impl is not json:
+                    indent = 0
+                _json_impl.dump(data, f, indent=indent, ensure_ascii=False, **_JSON_DUMP_OPTIONS)
+        print(f"✅ Saved data to {filepath}")
+        return True
+    except Exception as e:
+        print(f"❌ Error saving to JSON: {str(e)}")
+        return False
+
+def _dumps_json_bytes(data):
+    """
+    Serialize data to compact UTF-8 JSON bytes, using orjson when available.
+    
+    Args:
+        data (dict or list): Data to serialize
+        
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def save_to_json_gz(data, filepath):
+    """
+    Save data to a gzip-compressed JSON file.
+    
+    The data is serialized in one call and written in a single write, leaving
+    buffering to gzip and the OS. Compression level 1 keeps the write fast
+    while still shrinking the text-heavy plant data several times over.
+    
+    Args:
+        data (dict or list): Data to save
+        filepath (str): Path to save the file, usually ending in .json.gz
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        # Ensure the directory exists
+        ensure_directory_exists(os.path.dirname(filepath))
+        
+        buf = _dumps_json_bytes(data)
+        with gzip.open(filepath, 'wb', compresslevel=1) as f:
+            f.write(buf)
         print(f"✅ Saved data to {filepath}")
         return True
     except Exception as e:
         print(f"❌ Error saving to JSON: {str(e)}")
         return False
 
+def save_to_ndjson(records, filepath=None, append=False):
+    """
+    Save records to a newline-delimited JSON file, one record per line.
+    
+    Appending only writes the new records, so checkpointing a growing list costs
+    the size of the batch rather than the size of everything saved so far.
+    
+    Args:
+        records (list): Records to save
+        filepath (str, optional): Path to save the file. Defaults to config.PLANTS_PROGRESS_NDJSON.
+        append (bool, optional): Append to the file instead of overwriting it. Defaults to False.
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    filepath = filepath or config.PLANTS_PROGRESS_NDJSON
+    
+    try:
+        # Ensure the directory exists
+        ensure_directory_exists(os.path.dirname(filepath))
+        
+        with open(filepath, 'a' if append else 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        if not append:
+            print(f"✅ Saved {len(records)} records to {filepath}")
+        return True
+    except Exception as e:
+        print(f"❌ Error saving to NDJSON: {str(e)}")
+        return False
+
 def load_from_csv(filepath=None):
     """
     Load data from a CSV file.
@@ -95,10 +309,36 @@ def load_from_csv(filepath=None):
         print(f"❌ Error loading from CSV: {str(e)}")
         return None
 
+def load_rows_from_csv(filepath=None):
+    """
+    Load rows from a CSV file as dictionaries.
+    
+    Lighter than load_from_csv when the rows are only iterated over, since no
+    DataFrame is built. Empty cells are loaded as empty strings.
+    
+    Args:
+        filepath (str, optional): Path to the CSV file. Defaults to config.PLANTS_CSV.
+        
+    Returns:
+        list: List of row dictionaries or None if loading failed
+    """
+    filepath = filepath or config.PLANTS_CSV
+    
+    try:
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.DictReader(f))
+        print(f"✅ Loaded {len(rows)} rows from {filepath}")
+        return rows
+    except Exception as e:
+        print(f"❌ Error loading from CSV: {str(e)}")
+        return None
+
 def load_from_json(filepath=None):
     """
     Load data from a JSON file.
     
+    Paths ending in .json.gz are read with load_from_json_gz.
+    
     Args:
         filepath (str, optional): Path to the JSON file. Defaults to config.PLANTS_DETAILED_JSON.
         
@@ -106,12 +346,71 @@ def load_from_json(filepath=None):
         dict or list: Loaded data or None if loading failed
     """
     filepath = filepath or config.PLANTS_DETAILED_JSON
+    if filepath.endswith('.json.gz'):
+        return load_from_json_gz(filepath)
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Files written by json.dump may contain NaN, which orjson rejects
+                data = json.loads(raw)
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = _json_impl.load(f)
         print(f"✅ Loaded data from {filepath}")
         return data
     except Exception as e:
         print(f"❌ Error loading from JSON: {str(e)}")
         return None
+
+def load_from_json_gz(filepath):
+    """
+    Load data from a gzip-compressed JSON file.
+    
+    Args:
+        filepath (str): Path to the compressed JSON file
+        
+    Returns:
+        dict or list: Loaded data or None if loading failed
+    """
+    try:
+        with gzip.open(filepath, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Files written without orjson may contain NaN, which orjson rejects
+                data = json.loads(raw)
+        else:
+            data = json.loads(raw)
+        print(f"✅ Loaded data from {filepath}")
+        return data
+    except Exception as e:
+        print(f"❌ Error loading from JSON: {str(e)}")
+        return None
+
+def load_from_ndjson(filepath=None):
+    """
+    Load records from a newline-delimited JSON file.
+    
+    Args:
+        filepath (str, optional): Path to the NDJSON file. Defaults to config.PLANTS_PROGRESS_NDJSON.
+        
+    Returns:
+        list: Loaded records or None if loading failed
+    """
+    filepath = filepath or config.PLANTS_PROGRESS_NDJSON
+    
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        print(f"✅ Loaded {len(records)} records from {filepath}")
+        return records
+    except Exception as e:
+        print(f"❌ Error loading from NDJSON: {str(e)}")
+        return None
@@ -3,82 +3,425 @@ HTTP utility functions for making requests and handling responses.
 """
 
 import requests
+import httpx
 import time
+import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 import urllib3
+from requests.adapters import HTTPAdapter
 from src import config
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# lxml's C parser is much faster than the stdlib html.parser
+HTML_PARSER = "lxml"
+
 # Disable SSL verification warnings if configured
 if not config.VERIFY_SSL:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def get_soup(url, headers=None, timeout=None, verify=None):
+# Responses that mean the server is throttling us or struggling
+BACKOFF_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Shared session so requests to the same host reuse keep-alive connections
+# instead of paying a new TCP/TLS handshake per page. The adapter doesn't
+# retry: every throttling or server error reaches the rate limiter and
+# make_request_with_retry, which own all backoff.
+_POOL_SIZE = 16
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+class AdaptiveRateLimiter:
     """
-    Get BeautifulSoup object from URL.
+    Space out requests to a server, backing off while it struggles.
+    
+    Requests start at least `delay` seconds apart, measured from the start of the
+    previous request, so time spent waiting for a response counts towards the gap.
+    The delay doubles (up to max_delay) after a throttling or server error response
+    or a failed request, and halves back towards min_delay after each success.
+    """
+    
+    __slots__ = ('min_delay', 'max_delay', 'delay', '_next_start', '_lock')
+    
+    def __init__(self, min_delay=None, max_delay=None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            min_delay (float, optional): Smallest gap between requests in seconds.
+                                         Defaults to config.REQUEST_DELAY.
+            max_delay (float, optional): Largest gap to back off to in seconds.
+                                         Defaults to config.MAX_REQUEST_DELAY.
+        """
+        self.min_delay = config.REQUEST_DELAY if min_delay is None else min_delay
+        self.max_delay = config.MAX_REQUEST_DELAY if max_delay is None else max_delay
+        self.delay = self.min_delay
+        self._next_start = 0.0
+        # Slots may be claimed from several threads, e.g. by get_soups_batch
+        self._lock = threading.Lock()
+    
+    def _reserve(self):
+        """Claim the next request slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.delay
+        return start - now
+    
+    def wait(self):
+        """Block until the next request may start."""
+        pause = self._reserve()
+        if pause > 0:
+            time.sleep(pause)
+    
+    async def wait_async(self):
+        """Wait until the next request may start without blocking the event loop."""
+        pause = self._reserve()
+        if pause > 0:
+            await asyncio.sleep(pause)
+    
+    def record(self, status_code=None):
+        """
+        Adjust the delay to the outcome of a request.
+        
+        Args:
+            status_code (int, optional): Response status, or None if the request failed
+        """
+        if status_code is None or status_code in BACKOFF_STATUSES:
+            self.delay = min(max(self.delay * 2, 1.0), self.max_delay)
+        else:
+            self.delay = max(self.delay / 2, self.min_delay)
+
+def fetch_html(url, headers=None, timeout=None, verify=None, rate_limiter=None):
+    """
+    Fetch the raw HTML of a URL.
     
     Args:
         url (str): URL to request
         headers (dict, optional): HTTP headers to use. Defaults to config.HTTP_HEADERS.
         timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
         verify (bool, optional): Whether to verify SSL certificates. Defaults to config.VERIFY_SSL.
+        rate_limiter (AdaptiveRateLimiter, optional): Limiter to wait on before the request
+                                                      and to report its outcome to.
         
     Returns:
-        BeautifulSoup: Parsed HTML content or None if request failed
+        bytes: Response body or None if request failed
     """
     headers = headers or config.HTTP_HEADERS
     timeout = timeout or config.REQUEST_TIMEOUT
     verify = config.VERIFY_SSL if verify is None else verify
     
+    if rate_limiter is not None:
+        rate_limiter.wait()
+    
     try:
-        response = requests.get(url, headers=headers, timeout=timeout, verify=verify)
+        response = _SESSION.get(url, headers=headers, timeout=timeout, verify=verify)
+        if rate_limiter is not None:
+            rate_limiter.record(response.status_code)
         if response.status_code != 200:
             print(f"  ⚠️ Request failed with status {response.status_code}")
             return None
-        return BeautifulSoup(response.content, "html.parser")
+        return response.content
     except requests.exceptions.RequestException as e:
+        if rate_limiter is not None:
+            rate_limiter.record()
         print(f"  ❌ Request error: {str(e)}")
         return None
 
+def get_soup(url, headers=None, timeout=None, verify=None, parse_only=None):
+    """
+    Get BeautifulSoup object from URL.
+    
+    Args:
+        url (str): URL to request
+        headers (dict, optional): HTTP headers to use. Defaults to config.HTTP_HEADERS.
+        timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
+        verify (bool, optional): Whether to verify SSL certificates. Defaults to config.VERIFY_SSL.
+        parse_only (SoupStrainer, optional): Only build the parts of the page it matches.
+                                             Defaults to None (whole page).
+        
+    Returns:
+        BeautifulSoup: Parsed HTML content or None if request failed
+    """
+    html = fetch_html(url, headers, timeout, verify)
+    if html is None:
+        return None
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+def get_soups_batch(urls, headers=None, timeout=None, verify=None, parse_only=None, max_workers=None,
+                    rate_limiter=None):
+    """
+    Get BeautifulSoup objects for several URLs concurrently.
+    
+    Requests spend most of their time waiting on the network, so a thread pool
+    overlaps them while the shared session reuses its pooled connections. Every
+    request still goes through a rate limiter, so the site sees the same pace as
+    an asynchronous scrape.
+    
+    Args:
+        urls (iterable): URLs to request
+        headers (dict, optional): HTTP headers to use. Defaults to config.HTTP_HEADERS.
+        timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
+        verify (bool, optional): Whether to verify SSL certificates. Defaults to config.VERIFY_SSL.
+        parse_only (SoupStrainer, optional): Only build the parts of each page it matches.
+                                             Defaults to None (whole page).
+        max_workers (int, optional): Maximum concurrent requests. Defaults to config.CONCURRENCY.
+        rate_limiter (AdaptiveRateLimiter, optional): Limiter shared by all requests. Defaults to
+                                                      one allowing max_workers requests per
+                                                      config.REQUEST_DELAY.
+        
+    Returns:
+        list: Parsed HTML content for each URL, in order, with None where a request failed
+    """
+    max_workers = max_workers or config.CONCURRENCY
+    if rate_limiter is None:
+        rate_limiter = AdaptiveRateLimiter(config.REQUEST_DELAY / max_workers)
+    
+    def get_page_soup(url):
+        html = fetch_html(url, headers, timeout, verify, rate_limiter=rate_limiter)
+        if html is None:
+            return None
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_page_soup, urls))
+
+def parse_html_section(html, selector, parse_only):
+    """
+    Parse only one section of a page into a BeautifulSoup object.
+    
+    When selectolax is installed, its Lexbor parser finds the section and only
+    that fragment is built into a BeautifulSoup tree, which is several times
+    faster than filtering the whole page through a SoupStrainer. Otherwise the
+    page is parsed with the strainer.
+    
+    Args:
+        html (bytes or str): Page content
+        selector (str): CSS selector of the section
+        parse_only (SoupStrainer): Strainer matching the same section
+        
+    Returns:
+        BeautifulSoup: Parsed section (empty if the page has no such section)
+    """
+    if LexborHTMLParser is None:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    
+    section = LexborHTMLParser(html).css_first(selector)
+    return BeautifulSoup(section.html if section is not None else "", HTML_PARSER)
+
+async def fetch_html_async(client, url, timeout=None, rate_limiter=None):
+    """
+    Fetch the raw HTML of a URL without blocking the event loop.
+    
+    Args:
+        client (httpx.AsyncClient): Client carrying the headers and SSL settings to use
+        url (str): URL to request
+        timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
+        rate_limiter (AdaptiveRateLimiter, optional): Limiter to wait on before the request
+                                                      and to report its outcome to.
+        
+    Returns:
+        bytes: Response body or None if request failed
+    """
+    timeout = timeout or config.REQUEST_TIMEOUT
+    
+    if rate_limiter is not None:
+        await rate_limiter.wait_async()
+    
+    try:
+        response = await client.get(url, timeout=timeout)
+        if rate_limiter is not None:
+            rate_limiter.record(response.status_code)
+        if response.status_code != 200:
+            print(f"  ⚠️ Request failed with status {response.status_code}")
+            return None
+        return response.content
+    except httpx.HTTPError as e:
+        if rate_limiter is not None:
+            rate_limiter.record()
+        print(f"  ❌ Request error: {str(e)}")
+        return None
+
+async def get_soup_async(client, url, timeout=None, parse_only=None):
+    """
+    Get BeautifulSoup object from URL without blocking the event loop.
+    
+    Args:
+        client (httpx.AsyncClient): Client carrying the headers and SSL settings to use
+        url (str): URL to request
+        timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
+        parse_only (SoupStrainer, optional): Only build the parts of the page it matches.
+                                             Defaults to None (whole page).
+        
+    Returns:
+        BeautifulSoup: Parsed HTML content or None if request failed
+    """
+    html = await fetch_html_async(client, url, timeout)
+    if html is None:
+        return None
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
 def save_html_to_file(content, filename):
     """
     Save HTML content to a file.
     
+    Raw page content (e.g. from fetch_html) is written as-is; BeautifulSoup
+    objects are pretty-printed.
+    
     Args:
-        content (BeautifulSoup): BeautifulSoup object to save
+        content (bytes, str or BeautifulSoup): Page content or BeautifulSoup object to save
         filename (str): Path to save the file
     """
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(content.prettify())
+    if isinstance(content, bytes):
+        with open(filename, 'wb') as f:
+            f.write(content)
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(content if isinstance(content, str) else content.prettify())
     print(f"Content saved to {filename}")
 
-def make_request_with_retry(url, headers=None, timeout=None, verify=None, max_retries=3, retry_delay=2):
+def _retry_backoff(attempt, retry_delay):
+    """
+    Pick how long to sleep before retrying a failed request.
+    
+    Uses capped exponential backoff with full jitter, so retries against a
+    recovered server come back quickly and concurrent scrapers don't all wake
+    at the same moment.
+    
+    Args:
+        attempt (int): Zero-based index of the attempt that just failed
+        retry_delay (float): Base delay in seconds
+        
+    Returns:
+        float: Seconds to sleep
+    """
+    return min(config.MAX_REQUEST_DELAY, retry_delay * 2 ** attempt) * random.random()
+
+def make_request_with_retry(url, headers=None, timeout=None, verify=None, max_retries=3, retry_delay=2,
+                            rate_limiter=None, max_total_wait=None):
     """
     Make a request with retry logic.
     
+    Failed connections and throttling or server error responses are retried.
+    
     Args:
         url (str): URL to request
         headers (dict, optional): HTTP headers to use. Defaults to config.HTTP_HEADERS.
         timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
         verify (bool, optional): Whether to verify SSL certificates. Defaults to config.VERIFY_SSL.
         max_retries (int, optional): Maximum number of retries. Defaults to 3.
-        retry_delay (int, optional): Delay between retries in seconds. Defaults to 2.
+        retry_delay (int, optional): Base delay between retries in seconds, doubled on each
+                                     attempt and jittered. Defaults to 2.
+                                     Ignored when a rate limiter paces the attempts.
+        rate_limiter (AdaptiveRateLimiter, optional): Limiter to wait on before each attempt
+                                                      and to report its outcome to.
+        max_total_wait (float, optional): Give up instead of sleeping past this many seconds
+                                          from the first attempt. Defaults to config.MAX_RETRY_WAIT.
         
     Returns:
-        requests.Response: Response object or None if all retries failed
+        requests.Response: Response object, which after retries may still be a throttling
+                           or server error, or None if all attempts failed to connect
     """
     headers = headers or config.HTTP_HEADERS
     timeout = timeout or config.REQUEST_TIMEOUT
     verify = config.VERIFY_SSL if verify is None else verify
+    max_total_wait = config.MAX_RETRY_WAIT if max_total_wait is None else max_total_wait
+    deadline = time.monotonic() + max_total_wait
     
     for attempt in range(max_retries):
+        if rate_limiter is not None:
+            rate_limiter.wait()
         try:
-            response = requests.get(url, headers=headers, timeout=timeout, verify=verify)
-            return response
+            response = _SESSION.get(url, headers=headers, timeout=timeout, verify=verify)
         except requests.exceptions.RequestException as e:
+            if rate_limiter is not None:
+                rate_limiter.record()
+            print(f"  ⚠️ Request failed (attempt {attempt+1}/{max_retries}): {str(e)}")
+            response = None
+        else:
+            if rate_limiter is not None:
+                rate_limiter.record(response.status_code)
+            # Throttling and server errors are retried; the last one is returned as is
+            if response.status_code not in BACKOFF_STATUSES or attempt == max_retries - 1:
+                return response
+            print(f"  ⚠️ Request failed with status {response.status_code} (attempt {attempt+1}/{max_retries})")
+        
+        if attempt < max_retries - 1:
+            # With a rate limiter the next attempt waits out its backed-off delay instead
+            if rate_limiter is None:
+                delay = _retry_backoff(attempt, retry_delay)
+                if time.monotonic() + delay > deadline:
+                    print("  ❌ Giving up, retry deadline reached")
+                    return response
+                print(f"  Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
+        else:
+            print("  ❌ All retries failed")
+            return None
+
+async def make_request_with_retry_async(client, url, timeout=None, max_retries=3, retry_delay=2,
+                                        rate_limiter=None, max_total_wait=None):
+    """
+    Make a request with retry logic without blocking the event loop.
+    
+    Failed connections and throttling or server error responses are retried.
+    
+    Args:
+        client (httpx.AsyncClient): Client carrying the headers and SSL settings to use
+        url (str): URL to request
+        timeout (int, optional): Request timeout in seconds. Defaults to config.REQUEST_TIMEOUT.
+        max_retries (int, optional): Maximum number of retries. Defaults to 3.
+        retry_delay (int, optional): Base delay between retries in seconds, doubled on each
+                                     attempt and jittered. Defaults to 2.
+                                     Ignored when a rate limiter paces the attempts.
+        rate_limiter (AdaptiveRateLimiter, optional): Limiter to wait on before each attempt
+                                                      and to report its outcome to.
+        max_total_wait (float, optional): Give up instead of sleeping past this many seconds
+                                          from the first attempt. Defaults to config.MAX_RETRY_WAIT.
+        
+    Returns:
+        httpx.Response: Response object, which after retries may still be a throttling
+                        or server error, or None if all attempts failed to connect
+    """
+    timeout = timeout or config.REQUEST_TIMEOUT
+    max_total_wait = config.MAX_RETRY_WAIT if max_total_wait is None else max_total_wait
+    deadline = time.monotonic() + max_total_wait
+    
+    for attempt in range(max_retries):
+        if rate_limiter is not None:
+            await rate_limiter.wait_async()
+        try:
+            response = await client.get(url, timeout=timeout)
+        except httpx.HTTPError as e:
+            if rate_limiter is not None:
+                rate_limiter.record()
             print(f"  ⚠️ Request failed (attempt {attempt+1}/{max_retries}): {str(e)}")
-            if attempt < max_retries - 1:
-                print(f"  Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                print(f"  ❌ All retries failed")
-                return None
+            response = None
+        else:
+            if rate_limiter is not None:
+                rate_limiter.record(response.status_code)
+            # Throttling and server errors are retried; the last one is returned as is
+            if response.status_code not in BACKOFF_STATUSES or attempt == max_retries - 1:
+                return response
+            print(f"  ⚠️ Request failed with status {response.status_code} (attempt {attempt+1}/{max_retries})")
+        
+        if attempt < max_retries - 1:
+            # With a rate limiter the next attempt waits out its backed-off delay instead
+            if rate_limiter is None:
+                delay = _retry_backoff(attempt, retry_delay)
+                if time.monotonic() + delay > deadline:
+                    print("  ❌ Giving up, retry deadline reached")
+                    return response
+                print(f"  Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+        else:
+            print("  ❌ All retries failed")
+            return None
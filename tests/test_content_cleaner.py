@@ -0,0 +1,53 @@
+"""
+Tests for the content cleaner module.
+"""
+
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path so we can import our modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.processors.content_cleaner import clean_advertisement_content
+
+def test_clean_advertisement_content():
+    """Test clean_advertisement_content drops ad lines and truncates lines at ad text."""
+    content = (
+        "Water regularly.\n"
+        "ADVERTISEMENT\n"
+        "  Advertisement  \n"
+        "Advertisement and more\n"
+        "Mulch well.\n"
+        "  ADVERTISEMENT then text\n"
+        "Harvest in fall. Advertisement here\n"
+        "  Keep indented"
+    )
+    
+    assert clean_advertisement_content(content) == (
+        "Water regularly.\n"
+        "Mulch well.\n"
+        "\n"
+        "Harvest in fall.\n"
+        "  Keep indented"
+    )
+
+def test_clean_advertisement_content_without_ads():
+    """Test clean_advertisement_content returns content without ads unchanged."""
+    content = "  Sow seeds.\n\nThin seedlings.  "
+    
+    assert clean_advertisement_content(content) == content
+
+def test_clean_advertisement_content_other_whitespace():
+    """Test clean_advertisement_content strips non-breaking spaces and carriage returns around ads."""
+    content = (
+        "Water regularly.\r\n"
+        "\xa0ADVERTISEMENT\r\n"
+        "Harvest in fall.\xa0Advertisement here\r\n"
+        "Mulch well.\r"
+    )
+    
+    assert clean_advertisement_content(content) == (
+        "Water regularly.\r\n"
+        "Harvest in fall.\n"
+        "Mulch well."
+    )
@@ -16,47 +16,138 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from src.utils.file_io import (
     ensure_directory_exists,
     save_to_csv,
+    append_row_to_csv,
+    save_to_csv_streaming,
     save_to_json,
+    save_to_json_gz,
+    save_to_ndjson,
     load_from_csv,
-    load_from_json
+    load_rows_from_csv,
+    load_from_json,
+    load_from_json_gz,
+    load_from_ndjson
 )
+from src.utils import file_io
 from src import config
 
+requires_orjson = pytest.mark.skipif(file_io.orjson is None, reason="orjson is not installed")
+
 @patch("os.makedirs")
 def test_ensure_directory_exists(mock_makedirs):
     """Test ensure_directory_exists."""
     ensure_directory_exists("test_dir")
     mock_makedirs.assert_called_once_with("test_dir", exist_ok=True)
 
-@patch("os.path.dirname")
-@patch("src.utils.file_io.ensure_directory_exists")
-@patch("pandas.DataFrame.to_csv")
-def test_save_to_csv_list(mock_to_csv, mock_ensure_dir, mock_dirname):
-    """Test save_to_csv with a list."""
-    mock_dirname.return_value = "test_dir"
+def test_save_to_csv_list(tmp_path):
+    """Test save_to_csv with a list writes the same file as a DataFrame would."""
+    data = [
+        {"name": "Plant 1", "url": "http://example.com/1"},
+        {"name": "Crème, \"2\"", "image": None},
+    ]
+    filepath = tmp_path / "test.csv"
     
-    data = [{"name": "Plant 1", "url": "http://example.com/1"}]
-    result = save_to_csv(data, "test.csv")
+    result = save_to_csv(data, str(filepath))
     
     assert result is True
-    mock_dirname.assert_called_once_with("test.csv")
-    mock_ensure_dir.assert_called_once_with("test_dir")
-    mock_to_csv.assert_called_once_with("test.csv", index=False)
+    pandas_filepath = tmp_path / "pandas.csv"
+    pd.DataFrame(data).to_csv(pandas_filepath, index=False)
+    assert filepath.read_bytes() == pandas_filepath.read_bytes()
+
+def test_save_to_csv_list_append(tmp_path):
+    """Test save_to_csv appends list batches under the header written by the first one."""
+    data = [
+        {"name": "Plant 1", "url": "http://example.com/1"},
+        {"name": "Plant 2", "url": "http://example.com/2"},
+        {"url": "http://example.com/3", "name": "Plant 3"},
+    ]
+    filepath = tmp_path / "test.csv"
+    oneshot_filepath = tmp_path / "oneshot.csv"
+    
+    assert save_to_csv(data[:1], str(filepath), append=True) is True
+    assert save_to_csv(data[1:], str(filepath), append=True) is True
+    
+    save_to_csv(data, str(oneshot_filepath))
+    assert filepath.read_bytes() == oneshot_filepath.read_bytes()
 
 @patch("os.path.dirname")
 @patch("src.utils.file_io.ensure_directory_exists")
+@patch("src.utils.file_io._read_csv_header")
 @patch("pandas.DataFrame.to_csv")
-def test_save_to_csv_dataframe(mock_to_csv, mock_ensure_dir, mock_dirname):
-    """Test save_to_csv with a DataFrame."""
+def test_save_to_csv_dataframe_chunked(mock_to_csv, mock_read_header, mock_ensure_dir, mock_dirname):
+    """Test save_to_csv only writes the header for the first appended DataFrame."""
     mock_dirname.return_value = "test_dir"
+    mock_read_header.side_effect = [None, ["name", "url"]]
+    data = pd.DataFrame([{"name": "Plant 1", "url": "http://example.com/1"}])
+    
+    assert save_to_csv(data, "test.csv", chunksize=500, append=True) is True
+    assert save_to_csv(data, "test.csv", chunksize=500, append=True) is True
     
+    first, second = mock_to_csv.call_args_list
+    assert first.kwargs == {"index": False, "mode": "a", "header": True, "chunksize": 500}
+    assert second.kwargs == {"index": False, "mode": "a", "header": False, "chunksize": 500}
+
+def test_append_row_to_csv(tmp_path):
+    """Test append_row_to_csv writes the header once and follows its column order."""
+    filepath = tmp_path / "out" / "test.csv"
+    
+    assert append_row_to_csv({"name": "Plant 1", "url": "http://example.com/1"}, str(filepath)) is True
+    assert append_row_to_csv({"url": "http://example.com/2", "name": "Plant 2"}, str(filepath)) is True
+    
+    assert filepath.read_bytes() == (
+        b"name,url\n"
+        b"Plant 1,http://example.com/1\n"
+        b"Plant 2,http://example.com/2\n"
+    )
+
+def test_save_to_csv_dataframe(tmp_path):
+    """Test save_to_csv with a DataFrame."""
     data = pd.DataFrame([{"name": "Plant 1", "url": "http://example.com/1"}])
-    result = save_to_csv(data, "test.csv")
+    filepath = tmp_path / "out" / "test.csv"
+    
+    result = save_to_csv(data, str(filepath))
     
     assert result is True
-    mock_dirname.assert_called_once_with("test.csv")
-    mock_ensure_dir.assert_called_once_with("test_dir")
-    mock_to_csv.assert_called_once_with("test.csv", index=False)
+    pd.testing.assert_frame_equal(pd.read_csv(filepath), data)
+
+def test_save_to_csv_streaming(tmp_path):
+    """Test save_to_csv_streaming writes rows from a generator."""
+    filepath = tmp_path / "plants.csv"
+    rows = ({"Name": f"Plant {i}", "Link": f"http://example.com/{i}"} for i in range(3))
+    
+    result = save_to_csv_streaming(rows, str(filepath), ["Name", "Link", "Image URL"])
+    
+    assert result == 3
+    assert filepath.read_bytes() == (
+        b"Name,Link,Image URL\n"
+        b"Plant 0,http://example.com/0,\n"
+        b"Plant 1,http://example.com/1,\n"
+        b"Plant 2,http://example.com/2,\n"
+    )
+
+def test_save_to_csv_streaming_failure(tmp_path):
+    """Test save_to_csv_streaming leaves an existing file alone when the rows fail midway."""
+    filepath = tmp_path / "plants.csv"
+    filepath.write_text("Name\nKale\n", encoding="utf-8")
+    
+    def rows():
+        yield {"Name": "Leek"}
+        raise KeyError("href")
+    
+    result = save_to_csv_streaming(rows(), str(filepath))
+    
+    assert result is None
+    assert filepath.read_text(encoding="utf-8") == "Name\nKale\n"
+    assert list(tmp_path.iterdir()) == [filepath]
+
+def test_save_to_csv_streaming_empty(tmp_path):
+    """Test save_to_csv_streaming leaves an existing file alone when there are no rows."""
+    filepath = tmp_path / "plants.csv"
+    filepath.write_text("Name\nKale\n", encoding="utf-8")
+    
+    result = save_to_csv_streaming(iter([]), str(filepath))
+    
+    assert result == 0
+    assert filepath.read_text(encoding="utf-8") == "Name\nKale\n"
 
 @patch("os.path.dirname")
 @patch("src.utils.file_io.ensure_directory_exists")
@@ -66,7 +157,7 @@ def test_save_to_csv_exception(mock_to_csv, mock_ensure_dir, mock_dirname):
     mock_dirname.return_value = "test_dir"
     mock_to_csv.side_effect = Exception("CSV error")
     
-    data = [{"name": "Plant 1", "url": "http://example.com/1"}]
+    data = pd.DataFrame([{"name": "Plant 1", "url": "http://example.com/1"}])
     result = save_to_csv(data, "test.csv")
     
     assert result is False
@@ -74,27 +165,47 @@ def test_save_to_csv_exception(mock_to_csv, mock_ensure_dir, mock_dirname):
     mock_ensure_dir.assert_called_once_with("test_dir")
     mock_to_csv.assert_called_once()
 
-@patch("os.path.dirname")
-@patch("src.utils.file_io.ensure_directory_exists")
-@patch("builtins.open", new_callable=mock_open)
-@patch("json.dump")
-def test_save_to_json(mock_json_dump, mock_file, mock_ensure_dir, mock_dirname):
-    """Test save_to_json."""
-    mock_dirname.return_value = "test_dir"
-    
+@patch("src.utils.file_io.orjson", None)
+def test_save_to_json(tmp_path):
+    """Test save_to_json with the json module."""
     data = {"name": "Plant 1", "url": "http://example.com/1"}
-    result = save_to_json(data, "test.json")
+    filepath = tmp_path / "out" / "test.json"
+    
+    result = save_to_json(data, str(filepath))
     
     assert result is True
-    mock_dirname.assert_called_once_with("test.json")
-    mock_ensure_dir.assert_called_once_with("test_dir")
-    mock_file.assert_called_once_with("test.json", "w", encoding="utf-8")
-    mock_json_dump.assert_called_once_with(data, mock_file(), indent=2, ensure_ascii=False)
+    assert filepath.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+
+@patch("src.utils.file_io.orjson", None)
+@patch("src.utils.file_io._JSON_DUMP_OPTIONS", {"escape_forward_slashes": False})
+@patch("src.utils.file_io._json_impl")
+def test_save_to_json_ujson(mock_ujson, tmp_path):
+    """Test save_to_json passes ujson an integer indent for compact output."""
+    data = {"name": "Plant 1", "url": "http://example.com/1"}
+    filepath = tmp_path / "test.json"
+    
+    assert save_to_json(data, str(filepath), indent=None) is True
+    assert save_to_json(data, str(filepath)) is True
+    
+    first, second = mock_ujson.dump.call_args_list
+    assert first.kwargs == {"indent": 0, "ensure_ascii": False, "escape_forward_slashes": False}
+    assert second.kwargs["indent"] == 2
 
+@patch("src.utils.file_io.orjson", None)
+def test_save_to_json_compact_without_orjson(tmp_path):
+    """Test save_to_json writes compact output through the installed json fallback."""
+    data = {"name": "Plant 1", "url": "http://example.com/1"}
+    filepath = tmp_path / "test.json"
+    
+    assert save_to_json(data, str(filepath), indent=None) is True
+    assert json.loads(filepath.read_text(encoding="utf-8")) == data
+    assert "\n" not in filepath.read_text(encoding="utf-8")
+
+@patch("src.utils.file_io.orjson", None)
 @patch("os.path.dirname")
 @patch("src.utils.file_io.ensure_directory_exists")
 @patch("builtins.open", new_callable=mock_open)
-@patch("json.dump")
+@patch("src.utils.file_io._json_impl.dump")
 def test_save_to_json_exception(mock_json_dump, mock_file, mock_ensure_dir, mock_dirname):
     """Test save_to_json with an exception."""
     mock_dirname.return_value = "test_dir"
@@ -109,6 +220,117 @@ def test_save_to_json_exception(mock_json_dump, mock_file, mock_ensure_dir, mock
     mock_file.assert_called_once_with("test.json", "w", encoding="utf-8")
     mock_json_dump.assert_called_once()
 
+@requires_orjson
+@patch("os.path.dirname")
+@patch("src.utils.file_io.ensure_directory_exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("src.utils.file_io.orjson.dumps")
+def test_save_to_json_orjson(mock_dumps, mock_file, mock_ensure_dir, mock_dirname):
+    """Test save_to_json writes orjson bytes in binary mode."""
+    mock_dirname.return_value = "test_dir"
+    mock_dumps.return_value = b'{"name":"Plant 1"}'
+    
+    data = {"name": "Plant 1"}
+    result = save_to_json(data, "test.json")
+    
+    assert result is True
+    mock_file.assert_called_once_with("test.json", "wb")
+    mock_dumps.assert_called_once()
+    assert mock_dumps.call_args.args == (data,)
+    assert mock_dumps.call_args.kwargs["option"] & file_io.orjson.OPT_INDENT_2
+    mock_file().write.assert_called_once_with(b'{"name":"Plant 1"}')
+
+@requires_orjson
+@patch("builtins.open", new_callable=mock_open, read_data=b'{"name": "Plant 1"}')
+@patch("src.utils.file_io.orjson.loads")
+def test_load_from_json_orjson(mock_loads, mock_file):
+    """Test load_from_json reads bytes and decodes them with orjson."""
+    mock_loads.return_value = {"name": "Plant 1"}
+    
+    result = load_from_json("test.json")
+    
+    assert result == {"name": "Plant 1"}
+    mock_file.assert_called_once_with("test.json", "rb")
+    mock_loads.assert_called_once_with(b'{"name": "Plant 1"}')
+
+def test_save_and_load_json_roundtrip(tmp_path):
+    """Test save_to_json and load_from_json round trip with the default serializer."""
+    filepath = str(tmp_path / "plants.json")
+    data = [{"Name": "Crème", "Image URL": "", "Sections": {"a": 1}}]
+    
+    assert save_to_json(data, filepath) is True
+    assert load_from_json(filepath) == data
+    
+    with open(filepath, encoding="utf-8") as f:
+        assert f.read().startswith('[\n  {\n    "Name": "Crème"')
+    
+    assert save_to_json(data, filepath, indent=None) is True
+    assert "\n" not in open(filepath, encoding="utf-8").read()
+    assert load_from_json(filepath) == data
+
+def test_load_from_json_with_nan(tmp_path):
+    """Test load_from_json reads NaN values written by json.dump."""
+    filepath = tmp_path / "plants.json"
+    filepath.write_text('[{"Name": "Kale", "Image URL": NaN}]', encoding="utf-8")
+    
+    result = load_from_json(str(filepath))
+    
+    assert result[0]["Name"] == "Kale"
+    assert result[0]["Image URL"] != result[0]["Image URL"]  # NaN
+
+@patch("os.path.dirname")
+@patch("src.utils.file_io.ensure_directory_exists")
+@patch("gzip.open", new_callable=mock_open)
+def test_save_to_json_gz(mock_gzip_open, mock_ensure_dir, mock_dirname):
+    """Test save_to_json routes .json.gz paths to a single compressed write."""
+    mock_dirname.return_value = "test_dir"
+    
+    data = {"name": "Plant 1", "url": "http://example.com/1"}
+    result = save_to_json(data, "test.json.gz")
+    
+    assert result is True
+    mock_dirname.assert_called_once_with("test.json.gz")
+    mock_ensure_dir.assert_called_once_with("test_dir")
+    mock_gzip_open.assert_called_once_with("test.json.gz", "wb", compresslevel=1)
+    mock_gzip_open().write.assert_called_once()
+    mock_gzip_open().flush.assert_not_called()
+    assert json.loads(mock_gzip_open().write.call_args.args[0]) == data
+
+@patch("os.path.dirname")
+@patch("src.utils.file_io.ensure_directory_exists")
+@patch("gzip.open", new_callable=mock_open)
+def test_save_to_json_gz_exception(mock_gzip_open, mock_ensure_dir, mock_dirname):
+    """Test save_to_json_gz with an exception."""
+    mock_dirname.return_value = "test_dir"
+    mock_gzip_open.side_effect = OSError("Disk full")
+    
+    result = save_to_json_gz({"name": "Plant 1"}, "test.json.gz")
+    
+    assert result is False
+
+@patch("gzip.open", new_callable=mock_open, read_data=b'{"name": "Plant 1"}')
+def test_load_from_json_gz(mock_gzip_open):
+    """Test load_from_json routes .json.gz paths to load_from_json_gz."""
+    result = load_from_json("test.json.gz")
+    
+    assert result == {"name": "Plant 1"}
+    mock_gzip_open.assert_called_once_with("test.json.gz", "rb")
+
+def test_save_and_load_json_gz_roundtrip(tmp_path):
+    """Test save_to_json_gz and load_from_json_gz round trip through a real file."""
+    filepath = str(tmp_path / "plants.json.gz")
+    data = [{"Name": "Crème", "Image URL": "", "Sections": {"a": 1}}]
+    
+    assert save_to_json(data, filepath) is True
+    with open(filepath, "rb") as f:
+        assert f.read(2) == b"\x1f\x8b"  # gzip magic number
+    assert load_from_json_gz(filepath) == data
+    assert load_from_json(filepath) == data
+
+def test_load_from_json_gz_missing_file(tmp_path):
+    """Test load_from_json_gz returns None for a missing file."""
+    assert load_from_json_gz(str(tmp_path / "missing.json.gz")) is None
+
 @patch("pandas.read_csv")
 def test_load_from_csv(mock_read_csv):
     """Test load_from_csv."""
@@ -131,22 +353,49 @@ def test_load_from_csv_exception(mock_read_csv):
     assert result is None
     mock_read_csv.assert_called_once_with("test.csv")
 
-@patch("builtins.open", new_callable=mock_open, read_data='{"name": "Plant 1", "url": "http://example.com/1"}')
-@patch("json.load")
-def test_load_from_json(mock_json_load, mock_file):
-    """Test load_from_json."""
-    mock_data = {"name": "Plant 1", "url": "http://example.com/1"}
-    mock_json_load.return_value = mock_data
+def test_load_rows_from_csv(tmp_path):
+    """Test load_rows_from_csv returns rows as dictionaries."""
+    filepath = tmp_path / "plants.csv"
+    filepath.write_text('Name,Link,Image URL\nTomato,http://example.com/1,\n"Kale, Curly",http://example.com/2,/k.jpg\n', encoding="utf-8")
     
-    result = load_from_json("test.json")
+    result = load_rows_from_csv(str(filepath))
     
-    assert result is not None
-    assert result == mock_data
-    mock_file.assert_called_once_with("test.json", "r", encoding="utf-8")
-    mock_json_load.assert_called_once_with(mock_file())
+    assert result == [
+        {"Name": "Tomato", "Link": "http://example.com/1", "Image URL": ""},
+        {"Name": "Kale, Curly", "Link": "http://example.com/2", "Image URL": "/k.jpg"},
+    ]
 
+def test_load_rows_from_csv_missing_file(tmp_path):
+    """Test load_rows_from_csv with a missing file."""
+    assert load_rows_from_csv(str(tmp_path / "missing.csv")) is None
+
+@patch("src.utils.file_io.orjson", None)
+def test_load_from_json(tmp_path):
+    """Test load_from_json with the json module."""
+    data = {"name": "Plant 1", "url": "http://example.com/1"}
+    filepath = tmp_path / "test.json"
+    filepath.write_text(json.dumps(data), encoding="utf-8")
+    
+    result = load_from_json(str(filepath))
+    
+    assert result == data
+
+@patch("src.utils.file_io.orjson", None)
+@patch("src.utils.file_io._json_impl.load")
+def test_load_from_json_without_orjson(mock_json_load, tmp_path):
+    """Test load_from_json parses through the json fallback when orjson is missing."""
+    filepath = tmp_path / "test.json"
+    filepath.write_text('{"name": "Plant 1"}', encoding="utf-8")
+    mock_json_load.return_value = {"name": "Plant 1"}
+    
+    result = load_from_json(str(filepath))
+    
+    assert result == {"name": "Plant 1"}
+    mock_json_load.assert_called_once()
+
+@patch("src.utils.file_io.orjson", None)
 @patch("builtins.open", new_callable=mock_open)
-@patch("json.load")
+@patch("src.utils.file_io._json_impl.load")
 def test_load_from_json_exception(mock_json_load, mock_file):
     """Test load_from_json with an exception."""
     mock_json_load.side_effect = Exception("JSON error")
@@ -156,3 +405,18 @@ def test_load_from_json_exception(mock_json_load, mock_file):
     assert result is None
     mock_file.assert_called_once_with("test.json", "r", encoding="utf-8")
     mock_json_load.assert_called_once()
+
+def test_save_and_load_ndjson(tmp_path):
+    """Test save_to_ndjson overwrites or appends and load_from_ndjson reads it back."""
+    filepath = str(tmp_path / "plants.ndjson")
+    
+    assert save_to_ndjson([{"Name": "Tomato"}], filepath) is True
+    assert save_to_ndjson([{"Name": "Crème"}, {"Name": "Kale"}], filepath, append=True) is True
+    assert load_from_ndjson(filepath) == [{"Name": "Tomato"}, {"Name": "Crème"}, {"Name": "Kale"}]
+    
+    assert save_to_ndjson([], filepath) is True
+    assert load_from_ndjson(filepath) == []
+
+def test_load_from_ndjson_missing_file(tmp_path):
+    """Test load_from_ndjson with a missing file."""
+    assert load_from_ndjson(str(tmp_path / "missing.ndjson")) is None
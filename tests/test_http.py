@@ -3,14 +3,22 @@ Tests for the HTTP utility module.
 """
 
 import sys
+import asyncio
+import httpx
 import pytest
-from unittest.mock import patch, MagicMock
+import requests
+from unittest.mock import patch, MagicMock, AsyncMock
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the parent directory to the Python path so we can import our modules
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from src.utils.http import get_soup, save_html_to_file, make_request_with_retry
+from bs4 import SoupStrainer
+from src.utils.http import (
+    _SESSION, AdaptiveRateLimiter, get_soup, get_soup_async, get_soups_batch, parse_html_section, save_html_to_file,
+    make_request_with_retry, make_request_with_retry_async
+)
 from src import config
 
 @pytest.fixture
@@ -29,7 +37,7 @@ def mock_failed_response():
     mock.content = b"Not Found"
     return mock
 
-@patch("src.utils.http.requests.get")
+@patch("src.utils.http._SESSION.get")
 def test_get_soup_success(mock_get, mock_response):
     """Test get_soup with a successful response."""
     mock_get.return_value = mock_response
@@ -45,7 +53,25 @@ def test_get_soup_success(mock_get, mock_response):
         verify=config.VERIFY_SSL
     )
 
-@patch("src.utils.http.requests.get")
+def test_session_does_not_retry():
+    """Test that the shared session leaves retries to the rate limiter and retry loop."""
+    retry = _SESSION.get_adapter("https://www.almanac.com").max_retries
+    
+    assert retry.total == 0
+    assert not retry.status_forcelist
+
+@patch("src.utils.http.BeautifulSoup")
+@patch("src.utils.http._SESSION.get")
+def test_get_soup_uses_lxml(mock_get, mock_soup, mock_response):
+    """Test get_soup parses with lxml and passes the strainer through."""
+    mock_get.return_value = mock_response
+    strainer = SoupStrainer("h1")
+    
+    get_soup("https://example.com", parse_only=strainer)
+    
+    mock_soup.assert_called_once_with(mock_response.content, "lxml", parse_only=strainer)
+
+@patch("src.utils.http._SESSION.get")
 def test_get_soup_failure(mock_get, mock_failed_response):
     """Test get_soup with a failed response."""
     mock_get.return_value = mock_failed_response
@@ -55,16 +81,49 @@ def test_get_soup_failure(mock_get, mock_failed_response):
     assert soup is None
     mock_get.assert_called_once()
 
-@patch("src.utils.http.requests.get")
+@patch("src.utils.http._SESSION.get")
 def test_get_soup_exception(mock_get):
     """Test get_soup with an exception."""
-    mock_get.side_effect = Exception("Connection error")
+    mock_get.side_effect = requests.exceptions.ConnectionError("Connection error")
     
     soup = get_soup("https://example.com")
     
     assert soup is None
     mock_get.assert_called_once()
 
+def test_get_soup_async_success(mock_response):
+    """Test get_soup_async with a successful response."""
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(return_value=mock_response)
+    
+    soup = asyncio.run(get_soup_async(mock_client, "https://example.com"))
+    
+    assert soup is not None
+    assert soup.find("h1").text == "Test Page"
+    mock_client.get.assert_awaited_once_with("https://example.com", timeout=config.REQUEST_TIMEOUT)
+
+def test_get_soup_async_exception():
+    """Test get_soup_async with a transport error."""
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection error"))
+    
+    soup = asyncio.run(get_soup_async(mock_client, "https://example.com"))
+    
+    assert soup is None
+    mock_client.get.assert_awaited_once()
+
+def test_parse_html_section():
+    """Test parse_html_section keeps only the requested section."""
+    html = b'<html><body><p>Nav</p><div id="main"><p>Caf\xc3\xa9 &amp; more</p></div></body></html>'
+    
+    soup = parse_html_section(html, "#main", SoupStrainer(id="main"))
+    
+    assert soup.select_one("#main p").text == "Café & more"
+    assert len(soup.find_all("p")) == 1
+    
+    empty = parse_html_section(b"<html><body></body></html>", "#main", SoupStrainer(id="main"))
+    assert empty.select("#main") == []
+
 @patch("builtins.open", new_callable=MagicMock)
 def test_save_html_to_file(mock_open):
     """Test save_html_to_file."""
@@ -77,7 +136,50 @@ def test_save_html_to_file(mock_open):
     mock_file = mock_open.return_value.__enter__.return_value
     mock_file.write.assert_called_once_with("<html>\n  <body>\n    <h1>Test Page</h1>\n  </body>\n</html>")
 
-@patch("src.utils.http.requests.get")
+def test_save_html_to_file_raw(tmp_path):
+    """Test save_html_to_file writes raw content without re-rendering it."""
+    html = "<html><body><h1>Crème</h1></body></html>"
+    
+    save_html_to_file(html.encode("utf-8"), str(tmp_path / "bytes.html"))
+    save_html_to_file(html, str(tmp_path / "str.html"))
+    
+    assert (tmp_path / "bytes.html").read_bytes() == html.encode("utf-8")
+    assert (tmp_path / "str.html").read_text(encoding="utf-8") == html
+
+@patch("src.utils.http._SESSION.get")
+def test_get_soups_batch(mock_get, mock_failed_response):
+    """Test get_soups_batch fetches every URL through the shared session, keeping order."""
+    def fake_get(url, **kwargs):
+        if url.endswith("/missing"):
+            return mock_failed_response
+        response = MagicMock()
+        response.status_code = 200
+        response.content = f"<html><body><h1>{url}</h1></body></html>".encode("utf-8")
+        return response
+    mock_get.side_effect = fake_get
+    urls = [f"https://example.com/{i}" for i in range(10)] + ["https://example.com/missing"]
+    
+    limiter = MagicMock()
+    
+    soups = get_soups_batch(urls, max_workers=4, rate_limiter=limiter)
+    
+    assert [soup.find("h1").text for soup in soups[:-1]] == urls[:-1]
+    assert soups[-1] is None
+    assert mock_get.call_count == len(urls)
+    assert limiter.wait.call_count == len(urls)
+    assert limiter.record.call_count == len(urls)
+
+@patch("src.utils.http.time.monotonic", return_value=100.0)
+def test_rate_limiter_threads_claim_distinct_slots(mock_monotonic):
+    """Test AdaptiveRateLimiter hands out one slot per request across threads."""
+    limiter = AdaptiveRateLimiter(min_delay=1.0)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pauses = list(executor.map(lambda _: limiter._reserve(), range(50)))
+    
+    assert sorted(pauses) == [float(i) for i in range(50)]
+
+@patch("src.utils.http._SESSION.get")
 @patch("src.utils.http.time.sleep")
 def test_make_request_with_retry_success(mock_sleep, mock_get, mock_response):
     """Test make_request_with_retry with a successful response."""
@@ -90,14 +192,152 @@ def test_make_request_with_retry_success(mock_sleep, mock_get, mock_response):
     mock_get.assert_called_once()
     mock_sleep.assert_not_called()
 
-@patch("src.utils.http.requests.get")
+@patch("src.utils.http._SESSION.get")
 @patch("src.utils.http.time.sleep")
-def test_make_request_with_retry_failure(mock_sleep, mock_get):
+@patch("src.utils.http.random.random", return_value=0.5)
+def test_make_request_with_retry_failure(mock_random, mock_sleep, mock_get):
     """Test make_request_with_retry with failures."""
-    mock_get.side_effect = [Exception("Connection error"), Exception("Connection error"), mock_response]
+    mock_get.side_effect = requests.exceptions.ConnectionError("Connection error")
     
     response = make_request_with_retry("https://example.com", max_retries=3)
     
     assert response is None
     assert mock_get.call_count == 3
     assert mock_sleep.call_count == 2
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+@patch("src.utils.http._SESSION.get")
+@patch("src.utils.http.time.sleep")
+@patch("src.utils.http.random.random", return_value=0.5)
+def test_make_request_with_retry_server_error(mock_random, mock_sleep, mock_get, mock_response):
+    """Test make_request_with_retry retries throttling and server error responses."""
+    throttled = MagicMock(status_code=429)
+    unavailable = MagicMock(status_code=503)
+    mock_get.side_effect = [throttled, unavailable, mock_response]
+    
+    response = make_request_with_retry("https://example.com", max_retries=3)
+    
+    assert response is mock_response
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+@patch("src.utils.http._SESSION.get")
+@patch("src.utils.http.time.sleep")
+def test_make_request_with_retry_server_error_exhausted(mock_sleep, mock_get):
+    """Test make_request_with_retry returns the last server error once retries run out."""
+    unavailable = MagicMock(status_code=503)
+    mock_get.return_value = unavailable
+    
+    response = make_request_with_retry("https://example.com", max_retries=2)
+    
+    assert response is unavailable
+    assert mock_get.call_count == 2
+
+@patch("src.utils.http._SESSION.get")
+@patch("src.utils.http.time.sleep")
+def test_make_request_with_retry_server_error_rate_limited(mock_sleep, mock_get, mock_response):
+    """Test make_request_with_retry reports every server error to the rate limiter."""
+    mock_get.side_effect = [MagicMock(status_code=503), mock_response]
+    limiter = MagicMock()
+    
+    response = make_request_with_retry("https://example.com", rate_limiter=limiter)
+    
+    assert response is mock_response
+    assert [c.args for c in limiter.record.call_args_list] == [(503,), (200,)]
+    mock_sleep.assert_not_called()
+
+@patch("src.utils.http._SESSION.get")
+@patch("src.utils.http.time.sleep")
+@patch("src.utils.http.random.random", return_value=0.5)
+def test_make_request_with_retry_deadline(mock_random, mock_sleep, mock_get):
+    """Test make_request_with_retry gives up rather than sleeping past its deadline."""
+    mock_get.side_effect = requests.exceptions.ConnectionError("Connection error")
+    
+    response = make_request_with_retry("https://example.com", max_retries=3, max_total_wait=0.5)
+    
+    assert response is None
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+@patch("src.utils.http.time.sleep")
+@patch("src.utils.http.time.monotonic")
+def test_rate_limiter_spaces_requests(mock_monotonic, mock_sleep):
+    """Test AdaptiveRateLimiter counts time spent on the previous request towards the delay."""
+    limiter = AdaptiveRateLimiter(min_delay=1.0, max_delay=8.0)
+    
+    mock_monotonic.return_value = 100.0
+    limiter.wait()
+    mock_sleep.assert_not_called()
+    
+    mock_monotonic.return_value = 100.25  # previous request took 0.25s
+    limiter.wait()
+    mock_sleep.assert_called_once_with(0.75)
+
+def test_rate_limiter_backs_off_and_recovers():
+    """Test AdaptiveRateLimiter doubles the delay on errors and decays it on success."""
+    limiter = AdaptiveRateLimiter(min_delay=1.0, max_delay=8.0)
+    
+    limiter.record(429)
+    limiter.record(503)
+    limiter.record()
+    assert limiter.delay == 8.0
+    limiter.record(500)
+    assert limiter.delay == 8.0
+    
+    limiter.record(200)
+    assert limiter.delay == 4.0
+    for _ in range(5):
+        limiter.record(200)
+    assert limiter.delay == 1.0
+
+@patch("src.utils.http._SESSION.get")
+@patch("src.utils.http.time.sleep")
+def test_make_request_with_retry_rate_limited(mock_sleep, mock_get, mock_response):
+    """Test make_request_with_retry lets the rate limiter pace retries."""
+    mock_get.side_effect = [requests.exceptions.ConnectionError("Connection error"), mock_response]
+    limiter = MagicMock()
+    
+    response = make_request_with_retry("https://example.com", rate_limiter=limiter)
+    
+    assert response is mock_response
+    assert limiter.wait.call_count == 2
+    limiter.record.assert_any_call()
+    limiter.record.assert_called_with(200)
+    mock_sleep.assert_not_called()
+
+@patch("src.utils.http.asyncio.sleep", new_callable=AsyncMock)
+@patch("src.utils.http.random.random", return_value=0.5)
+def test_make_request_with_retry_async_success(mock_random, mock_sleep, mock_response):
+    """Test make_request_with_retry_async retries a transport error and returns the response."""
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=[httpx.ConnectError("Connection error"), mock_response])
+    
+    response = asyncio.run(make_request_with_retry_async(mock_client, "https://example.com"))
+    
+    assert response is mock_response
+    assert mock_client.get.await_count == 2
+    mock_sleep.assert_awaited_once_with(1.0)
+
+@patch("src.utils.http.asyncio.sleep", new_callable=AsyncMock)
+def test_make_request_with_retry_async_server_error(mock_sleep, mock_response):
+    """Test make_request_with_retry_async retries a server error response."""
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=[MagicMock(status_code=502), mock_response])
+    
+    response = asyncio.run(make_request_with_retry_async(mock_client, "https://example.com"))
+    
+    assert response is mock_response
+    assert mock_client.get.await_count == 2
+    mock_sleep.assert_awaited_once()
+
+@patch("src.utils.http.asyncio.sleep", new_callable=AsyncMock)
+def test_make_request_with_retry_async_failure(mock_sleep):
+    """Test make_request_with_retry_async with failures."""
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection error"))
+    
+    response = asyncio.run(make_request_with_retry_async(mock_client, "https://example.com", max_retries=3))
+    
+    assert response is None
+    assert mock_client.get.await_count == 3
+    assert mock_sleep.await_count == 2
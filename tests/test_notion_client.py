@@ -0,0 +1,64 @@
+"""
+Tests for the Notion client module.
+
+NOTE: The src.notion package is deprecated and will be removed in a future version.
+These tests are kept for backward compatibility during the transition period.
+"""
+
+import asyncio
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock
+
+pytest.importorskip("notion_client")
+
+from src.notion import config
+from src.notion.client import AsyncNotionClient, NotionClient, _RetryTransport, _AsyncRetryTransport
+
+@pytest.mark.parametrize("method, path, status_code, expected_calls", [
+    ("GET", "/v1/pages/abc", 502, 3),
+    ("PATCH", "/v1/pages/abc", 504, 3),
+    ("POST", "/v1/pages", 429, 3),
+    ("POST", "/v1/pages", 502, 1),
+    ("POST", "/v1/pages", 504, 1),
+    ("PATCH", "/v1/blocks/abc/children", 502, 1),
+    ("PATCH", "/v1/blocks/abc/children", 429, 3),
+    ("GET", "/v1/blocks/abc/children", 502, 3),
+    ("GET", "/v1/pages/abc", 404, 1),
+])
+@patch("src.notion.client.time.sleep")
+@patch("httpx.HTTPTransport.handle_request")
+def test_retry_transport(mock_handle_request, mock_sleep, method, path, status_code, expected_calls):
+    """Test _RetryTransport only repeats non-idempotent requests that were rate limited."""
+    mock_handle_request.side_effect = lambda request: httpx.Response(status_code)
+    transport = _RetryTransport(max_retries=2)
+    
+    response = transport.handle_request(httpx.Request(method, "https://api.notion.com" + path))
+    
+    assert response.status_code == status_code
+    assert mock_handle_request.call_count == expected_calls
+
+@patch("src.notion.client.asyncio.sleep", new_callable=AsyncMock)
+@patch("httpx.AsyncHTTPTransport.handle_async_request", new_callable=AsyncMock)
+def test_async_retry_transport_post(mock_handle_request, mock_sleep):
+    """Test _AsyncRetryTransport does not repeat a POST after a server error."""
+    mock_handle_request.return_value = httpx.Response(502)
+    transport = _AsyncRetryTransport(max_retries=2)
+    
+    response = asyncio.run(
+        transport.handle_async_request(httpx.Request("POST", "https://api.notion.com/v1/pages"))
+    )
+    
+    assert response.status_code == 502
+    mock_handle_request.assert_awaited_once()
+    mock_sleep.assert_not_awaited()
+
+@patch("src.notion.client._AsyncRetryTransport")
+@patch("src.notion.client._RetryTransport")
+def test_clients_use_configured_connection_limit(mock_transport, mock_async_transport):
+    """Test both Notion clients size their connection pools from config."""
+    NotionClient(api_key="secret", database_id="database")
+    AsyncNotionClient(api_key="secret", database_id="database")
+    
+    for transport in (mock_transport, mock_async_transport):
+        assert transport.call_args.kwargs["limits"].max_connections == config.NOTION_MAX_CONNECTIONS
@@ -8,7 +8,12 @@ These tests are kept for backward compatibility during the transition period.
 """
 
 import pytest
-from src.notion.schema import validate_database_schema, get_database_creation_schema, PLANT_DATABASE_SCHEMA
+from src.notion.schema import (
+    validate_database_schema,
+    get_database_creation_schema,
+    PLANT_DATABASE_SCHEMA,
+    SYNC_METADATA_SCHEMA
+)
 
 # Add a deprecation note at the top of the test file
 import warnings
@@ -205,3 +210,17 @@ def test_get_database_creation_schema():
     assert "rich_text" in schema["Wit and Wisdom"]
     assert "Cooking Notes" in schema
     assert "rich_text" in schema["Cooking Notes"]
+    
+    # Verify the sync metadata fields
+    assert "ContentHash" in schema
+    assert "rich_text" in schema["ContentHash"]
+
+def test_sync_metadata_not_required():
+    """Test that sync metadata properties are optional for validation."""
+    database = {"properties": dict(PLANT_DATABASE_SCHEMA)}
+    
+    is_valid, missing_properties = validate_database_schema(database)
+    
+    assert is_valid is True
+    for prop_name in SYNC_METADATA_SCHEMA:
+        assert prop_name not in missing_properties
@@ -0,0 +1,184 @@
+"""
+Tests for the Notion sync module.
+
+NOTE: The src.notion package is deprecated and will be removed in a future version.
+These tests are kept for backward compatibility during the transition period.
+"""
+
+import json
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+pytest.importorskip("notion_client")
+
+from src.notion.sync import (
+    CONTENT_HASH_PROPERTY,
+    compute_content_hash,
+    load_plants_data,
+    load_sync_state,
+    sync_plant_to_notion,
+    sync_plant_to_notion_async,
+    sync_plants_to_notion
+)
+
+PLANT = {
+    "Name": "Kale",
+    "Link": "http://example.com/kale",
+    "Image URL": "",
+    "Planting": {"content": "Sow in spring."}
+}
+
+@pytest.mark.parametrize("state", [
+    [],
+    {"pages": {}},
+    {"last_synced": "2024-01-01T00:00:00+00:00"},
+    {"last_synced": 1704067200, "pages": {}},
+    {"last_synced": "yesterday", "pages": {}},
+    {"last_synced": "2024-01-01T00:00:00+00:00", "pages": []},
+    {"last_synced": "2024-01-01T00:00:00+00:00", "pages": {}, "content_hashes": []},
+])
+def test_load_sync_state_invalid(tmp_path, state):
+    """Test load_sync_state falls back to a full sync for malformed state."""
+    filepath = tmp_path / "state.json"
+    filepath.write_text(json.dumps(state), encoding="utf-8")
+    
+    assert load_sync_state(str(filepath)) is None
+
+def test_load_sync_state(tmp_path):
+    """Test load_sync_state returns a well-formed state."""
+    state = {
+        "last_synced": "2024-01-01T00:00:00+00:00",
+        "pages": {"Kale": "page-1"},
+        "content_hashes": None
+    }
+    filepath = tmp_path / "state.json"
+    filepath.write_text(json.dumps(state), encoding="utf-8")
+    
+    assert load_sync_state(str(filepath)) == state
+
+def test_load_sync_state_missing_file(tmp_path):
+    """Test load_sync_state returns None when there is no state file."""
+    assert load_sync_state(str(tmp_path / "missing.json")) is None
+
+TRUNCATED_PLANTS_JSON = '[{"Name": "Kale", "Link": "http://example.com/kale"}, {"Name": "Lee'
+
+def test_load_plants_data_truncated(tmp_path):
+    """Test load_plants_data yields complete plants and then rejects a truncated one."""
+    filepath = tmp_path / "plants.json"
+    filepath.write_text(TRUNCATED_PLANTS_JSON, encoding="utf-8")
+    
+    plants = load_plants_data(str(filepath))
+    
+    assert next(plants)["Name"] == "Kale"
+    with pytest.raises(ValueError):
+        next(plants)
+
+@patch("src.notion.sync.save_sync_state")
+@patch("src.notion.sync.get_existing_plants", return_value=({}, {}))
+@patch("src.notion.sync.ensure_database_exists", return_value=True)
+@patch("src.notion.sync.config.validate_config", return_value=(True, None))
+def test_sync_plants_to_notion_truncated_file(mock_validate, mock_ensure_db, mock_existing, mock_save_state,
+                                              tmp_path):
+    """Test sync_plants_to_notion stops at a truncated plant and reports the error."""
+    filepath = tmp_path / "plants.json"
+    filepath.write_text(TRUNCATED_PLANTS_JSON, encoding="utf-8")
+    client = MagicMock()
+    
+    results = sync_plants_to_notion(client=client, file_path=str(filepath), incremental=True,
+                                    state_file=str(tmp_path / "state.json"))
+    
+    assert results["success"] is False
+    assert results["error"].startswith("Error loading plants data")
+    assert results["created"] == 1
+    client.create_page.assert_called_once()
+    mock_save_state.assert_not_called()
+
+def test_sync_plant_to_notion_unchanged():
+    """Test sync_plant_to_notion skips plants whose stored hash matches."""
+    client = MagicMock()
+    content_hashes = {"Kale": compute_content_hash(PLANT)}
+    
+    result = sync_plant_to_notion(client, PLANT, {"Kale": "page-1"}, content_hashes)
+    
+    assert result == (True, "unchanged", "")
+    client.update_page.assert_not_called()
+    client.append_block_children.assert_not_called()
+
+def test_sync_plant_to_notion_update():
+    """Test sync_plant_to_notion appends content before storing the new hash."""
+    client = MagicMock()
+    
+    result = sync_plant_to_notion(client, PLANT, {"Kale": "page-1"}, {"Kale": "stale"})
+    
+    assert result == (True, "updated", "")
+    assert [c[0] for c in client.mock_calls] == ["append_block_children", "update_page"]
+    page_id, properties = client.update_page.call_args.args
+    assert page_id == "page-1"
+    assert properties[CONTENT_HASH_PROPERTY]["rich_text"][0]["text"]["content"] == compute_content_hash(PLANT)
+    client.create_page.assert_not_called()
+
+def test_sync_plant_to_notion_append_failure():
+    """Test sync_plant_to_notion leaves the stored hash alone when the append fails."""
+    client = MagicMock()
+    client.append_block_children.side_effect = Exception("Bad gateway")
+    
+    result = sync_plant_to_notion(client, PLANT, {"Kale": "page-1"}, {"Kale": "stale"})
+    
+    assert result == (False, "skipped", "Bad gateway")
+    client.update_page.assert_not_called()
+
+def test_sync_plant_to_notion_async_append_failure():
+    """Test sync_plant_to_notion_async only updates properties after the append succeeds."""
+    client = MagicMock()
+    client.append_block_children = AsyncMock(side_effect=Exception("Bad gateway"))
+    client.update_page = AsyncMock()
+    
+    result = asyncio.run(sync_plant_to_notion_async(client, PLANT, {"Kale": "page-1"}, {"Kale": "stale"}))
+    
+    assert result == (False, "skipped", "Bad gateway")
+    client.update_page.assert_not_awaited()
+
+def test_sync_plant_to_notion_create():
+    """Test sync_plant_to_notion creates pages for new plants."""
+    client = MagicMock()
+    
+    result = sync_plant_to_notion(client, PLANT, {}, {})
+    
+    assert result == (True, "created", "")
+    client.create_page.assert_called_once()
+
+@patch("src.notion.sync.get_existing_plants", return_value=({"Kale": "page-1"}, {}))
+@patch("src.notion.sync.ensure_database_exists", return_value=True)
+@patch("src.notion.sync.config.validate_config", return_value=(True, None))
+def test_sync_plants_to_notion_duplicates(mock_validate, mock_ensure_db, mock_existing):
+    """Test sync_plants_to_notion writes each plant name once and counts duplicates as skipped."""
+    client = MagicMock()
+    plants = [PLANT, {**PLANT, "Cooking Notes": "Roast it."}, {**PLANT, "Name": "Leek"}]
+    
+    results = sync_plants_to_notion(plants, client=client)
+    
+    assert results["updated"] == 1
+    assert results["created"] == 1
+    assert results["skipped"] == 1
+    client.append_block_children.assert_called_once()
+    assert client.append_block_children.call_args.args[0] == "page-1"
+
+@patch("src.notion.sync.AsyncNotionClient")
+@patch("src.notion.sync.get_existing_plants", return_value=({}, {}))
+@patch("src.notion.sync.ensure_database_exists", return_value=True)
+@patch("src.notion.sync.config.validate_config", return_value=(True, None))
+def test_sync_plants_to_notion_async_uses_client_credentials(mock_validate, mock_ensure_db, mock_existing,
+                                                             mock_async_client_class):
+    """Test sync_plants_to_notion builds its async client for the given client's database."""
+    async_client = mock_async_client_class.return_value
+    async_client.create_page = AsyncMock()
+    async_client.aclose = AsyncMock()
+    client = MagicMock(api_key="secret_other", database_id="other-database")
+    
+    results = sync_plants_to_notion([PLANT], client=client, use_async=True)
+    
+    assert results["created"] == 1
+    mock_async_client_class.assert_called_once_with("secret_other", "other-database")
+    async_client.create_page.assert_awaited_once()
+    async_client.aclose.assert_awaited_once()
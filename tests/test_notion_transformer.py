@@ -87,6 +87,20 @@ def test_transform_plant_to_notion_properties():
     assert "Cooking Notes" in properties
     assert properties["Cooking Notes"]["rich_text"][0]["text"]["content"] == "Cooking instructions"
 
+def test_transform_plant_to_notion_properties_deduplicates_multi_select():
+    """Test that repeated multi-select values are only sent once."""
+    plant = {
+        "Name": "Test Plant",
+        "Sun Exposure": "Full Sun\nPart Sun\nFull Sun\n\n Part Sun "
+    }
+    
+    properties = transform_plant_to_notion_properties(plant)
+    
+    assert properties["Sun Exposure"]["multi_select"] == [
+        {"name": "Full Sun"},
+        {"name": "Part Sun"}
+    ]
+
 def test_create_rich_text_block():
     """Test creating a rich text block."""
     # Create a rich text block
@@ -255,47 +269,19 @@ def test_create_plant_content_blocks():
     assert blocks[0]["type"] == "image"
     assert blocks[0]["image"]["external"]["url"] == "https://example.com/image.jpg"
     
-    # Find planting section
-    planting_heading_index = next(
-        (i for i, block in enumerate(blocks) 
-         if block["type"] == "heading_2" and 
-         block["heading_2"]["rich_text"][0]["text"]["content"] == "Planting"),
-        None
-    )
-    assert planting_heading_index is not None
-    
-    # Find recipes section
-    recipes_heading_index = next(
-        (i for i, block in enumerate(blocks) 
-         if block["type"] == "heading_2" and 
-         block["heading_2"]["rich_text"][0]["text"]["content"] == "Recipes"),
-        None
-    )
-    assert recipes_heading_index is not None
-    
-    # Find pests and diseases section
-    pests_heading_index = next(
-        (i for i, block in enumerate(blocks) 
-         if block["type"] == "heading_2" and 
-         block["heading_2"]["rich_text"][0]["text"]["content"] == "Pests and Diseases"),
-        None
-    )
-    assert pests_heading_index is not None
-    
-    # Find wit and wisdom section
-    wisdom_heading_index = next(
-        (i for i, block in enumerate(blocks) 
-         if block["type"] == "heading_2" and 
-         block["heading_2"]["rich_text"][0]["text"]["content"] == "Wit and Wisdom"),
-        None
-    )
-    assert wisdom_heading_index is not None
-    
-    # Find cooking notes section
-    cooking_heading_index = next(
-        (i for i, block in enumerate(blocks) 
-         if block["type"] == "heading_2" and 
-         block["heading_2"]["rich_text"][0]["text"]["content"] == "Cooking Notes"),
-        None
-    )
-    assert cooking_heading_index is not None
+    # Find the sections in a single pass
+    same_blocks, section_index = create_plant_content_blocks(plant, section_index=True)
+    assert same_blocks == blocks
+    
+    for section in ["Planting", "Growing", "Harvesting", "Pests and Diseases", "Recipes",
+                    "Wit and Wisdom", "Cooking Notes"]:
+        assert section in section_index
+        heading = blocks[section_index[section]]
+        assert heading["type"] == "heading_2"
+        assert heading["heading_2"]["rich_text"][0]["text"]["content"] == section
+    
+    # Sub-headings are level 3 and not indexed as sections
+    assert "When to Plant" not in section_index
+    
+    # Sections appear in page order
+    assert section_index["Planting"] < section_index["Pests and Diseases"] < section_index["Recipes"]